@@ -0,0 +1,64 @@
+"""
+Shared sample data for the archive verification scripts.
+
+Treat these as read-only; copy before modifying.
+"""
+
+from typing import Final
+
+# Validation report covering every issue type the fixer handles
+TEST_REPORT: Final = {
+    "issues": [
+        {"type": "scroll", "severity": "medium", "description": "Page not scrollable"},
+        {"type": "overflow", "severity": "high", "description": "horizontal overflow"},
+        {"type": "accessibility", "severity": "medium", "description": "Missing title"},
+        {"type": "accessibility", "severity": "low", "description": "Images missing alt"},
+        {"type": "responsive", "severity": "high", "description": "Mobile issues"}
+    ]
+}
+
+# Page with no title, no viewport meta, images without alt text and a too-wide div
+PROBLEMATIC_HTML: Final = """
+<!DOCTYPE html>
+<html>
+<head></head>
+<body>
+    <h1>Test Website</h1>
+    <p>This page has several issues:</p>
+    <ul>
+        <li>No title</li>
+        <li>No viewport meta</li>
+        <li>Images without alt text</li>
+    </ul>
+    <img src="photo1.jpg">
+    <img src="photo2.png">
+    <div style="width: 3000px;">This is too wide!</div>
+</body>
+</html>
+"""
+
+# Small untitled page with one image missing alt text
+UNTITLED_HTML: Final = """
+<!DOCTYPE html>
+<html>
+<head></head>
+<body>
+    <h1>Test</h1>
+    <img src="test.jpg">
+</body>
+</html>
+"""
+
+# Smallest well-formed page, used to smoke-test the validator
+MINIMAL_HTML: Final = """
+<!DOCTYPE html>
+<html>
+<head>
+    <title>Test Page</title>
+</head>
+<body>
+    <h1>Hello World</h1>
+    <p>This is a test</p>
+</body>
+</html>
+"""
@@ -1,27 +1,14 @@
 """Debug test for visual validator"""
 
+from _fixtures import MINIMAL_HTML
 from src.visual_validator import validate_html_string
-import traceback
-
-# Test minimal HTML
-minimal_html = """
-<!DOCTYPE html>
-<html>
-<head>
-    <title>Test Page</title>
-</head>
-<body>
-    <h1>Hello World</h1>
-    <p>This is a test</p>
-</body>
-</html>
-"""
+from src.verify_utils import print_error
 
 print("Testing Visual Validator with detailed error tracking...")
 print("="*60)
 
 try:
-    report = validate_html_string(minimal_html, "debug_test.html")
+    report = validate_html_string(MINIMAL_HTML, "debug_test.html")
     
     print("\n✅ Validation completed!")
     print(f"Valid: {report['valid']}")
@@ -36,5 +23,4 @@ try:
     
 except Exception as e:
     print(f"\n❌ Error occurred: {e}")
-    print("\nFull traceback:")
-    traceback.print_exc()
+    print_error(e)
@@ -1,5 +1,6 @@
 """Quick test of fixer without visual validator dependency"""
 
+from _fixtures import UNTITLED_HTML
 from src.fixer import (
     analyze_issues,
     apply_fixes,
@@ -26,18 +27,7 @@ for action in actions:
 
 # Test 2: Apply fixes
 print("\nTest 2: Applying fixes...")
-html = """
-<!DOCTYPE html>
-<html>
-<head></head>
-<body>
-    <h1>Test</h1>
-    <img src="test.jpg">
-</body>
-</html>
-"""
-
-fixed_html, applied = apply_fixes(html, actions)
+fixed_html, applied = apply_fixes(UNTITLED_HTML, actions)
 print(f"✅ Applied {len(applied)} fixes:")
 for fix in applied:
     print(f"  ✓ {fix}")
@@ -1,26 +1,14 @@
 """Quick test for visual validator"""
 
+from _fixtures import MINIMAL_HTML
 from src.visual_validator import validate_html_string, generate_validation_summary
-
-# Test minimal HTML
-minimal_html = """
-<!DOCTYPE html>
-<html>
-<head>
-    <title>Test Page</title>
-</head>
-<body>
-    <h1>Hello World</h1>
-    <p>This is a test</p>
-</body>
-</html>
-"""
+from src.verify_utils import print_error
 
 print("Testing Visual Validator...")
 print("="*60)
 
 try:
-    report = validate_html_string(minimal_html, "quick_test.html")
+    report = validate_html_string(MINIMAL_HTML, "quick_test.html")
     
     print("\n✅ Validation completed successfully!")
     print(f"Valid: {report['valid']}")
@@ -33,5 +21,4 @@ try:
     
 except Exception as e:
     print(f"\n❌ Error: {e}")
-    import traceback
-    traceback.print_exc()
+    print_error(e)
@@ -3,192 +3,227 @@
 Comprehensive verification of Fixer Module
 """
 
-print("="*70)
-print("🔧 FIXER MODULE - COMPREHENSIVE VERIFICATION")
-print("="*70 + "\n")
-
-# Test 1: Import check
-print("Test 1: Importing fixer functions...")
-try:
-    from src.fixer import (
-        analyze_issues,
-        apply_fixes,
-        auto_fix_website,
-        fix_from_file,
-        generate_fix_summary
-    )
-    print("✅ All functions imported successfully\n")
-except ImportError as e:
-    print(f"❌ Import failed: {e}\n")
-    exit(1)
-
-# Test 2: Analyze various issue types
-print("Test 2: Testing issue analysis...")
-try:
-    test_report = {
-        "issues": [
-            {"type": "scroll", "severity": "medium", "description": "Page not scrollable"},
-            {"type": "overflow", "severity": "high", "description": "horizontal overflow"},
-            {"type": "accessibility", "severity": "medium", "description": "Missing title"},
-            {"type": "accessibility", "severity": "low", "description": "Images missing alt"},
-            {"type": "responsive", "severity": "high", "description": "Mobile issues"}
-        ]
-    }
-    
-    actions = analyze_issues(test_report)
-    
-    print(f"✅ Analyzed {len(test_report['issues'])} issues")
-    print(f"   Generated {len(actions)} fix actions:")
-    
-    for i, action in enumerate(actions[:5], 1):
-        print(f"   {i}. {action['type']} (Priority {action.get('priority', 'N/A')})")
-    
-    print()
-    
-except Exception as e:
-    print(f"❌ Analysis failed: {e}\n")
-    exit(1)
-
-# Test 3: Apply fixes to problematic HTML
-print("Test 3: Applying fixes to problematic HTML...")
-try:
-    problematic_html = """
-    <!DOCTYPE html>
-    <html>
-    <head></head>
-    <body>
-        <h1>Test Website</h1>
-        <p>This page has several issues:</p>
-        <ul>
-            <li>No title</li>
-            <li>No viewport meta</li>
-            <li>Images without alt text</li>
-        </ul>
-        <img src="photo1.jpg">
-        <img src="photo2.png">
-        <div style="width: 3000px;">This is too wide!</div>
-    </body>
-    </html>
-    """
-    
-    fixed_html, applied_fixes = apply_fixes(problematic_html, actions)
-    
-    print(f"✅ Applied {len(applied_fixes)} fixes:")
-    for fix in applied_fixes:
-        print(f"   ✓ {fix}")
-    
-    # Verify fixes were actually applied
-    checks = [
-        ("<title>" in fixed_html, "Title tag added"),
-        ('viewport' in fixed_html, "Viewport meta added"),
-        ('alt="' in fixed_html, "Alt text added"),
-        ('overflow-x' in fixed_html or 'max-width' in fixed_html, "Overflow fix applied")
+import json
+import sys
+import lxml.html
+
+from _fixtures import TEST_REPORT, PROBLEMATIC_HTML, UNTITLED_HTML
+
+BAR = "=" * 70
+_STATUS = {True: "✓", False: "✗"}
+
+# Names of failed tests; every test runs so one pass reports all failures
+FAILED: list[str] = []
+
+
+def head_and_alt_checks(html: str) -> list:
+    """(passed, description) for the title, viewport and alt text fixes in html."""
+    tree = lxml.html.fromstring(html)
+    return [
+        (tree.xpath('boolean(//title)'), "Title tag added"),
+        (tree.xpath('boolean(//meta[@name="viewport"])'), "Viewport meta added"),
+        (tree.xpath('boolean(//img[@alt])'), "Alt text added")
     ]
-    
+
+
+def print_checks(checks: list):
+    """Print a ✓/✗ line per (passed, description) check."""
     print("\n   Verification:")
     for check, description in checks:
-        status = "✓" if check else "✗"
-        print(f"   {status} {description}")
-    
-    print()
-    
-except Exception as e:
-    print(f"❌ Fix application failed: {e}\n")
-    import traceback
-    traceback.print_exc()
-    exit(1)
-
-# Test 4: Full auto-fix workflow
-print("Test 4: Testing full auto-fix workflow...")
-try:
-    test_html = """
-    <!DOCTYPE html>
-    <html>
-    <head></head>
-    <body style="height: 500px;">
-        <h1>Short Page</h1>
-        <img src="test.jpg">
-    </body>
-    </html>
-    """
-    
-    fixed_html, fix_report = auto_fix_website(test_html, max_attempts=2)
-    
-    print("✅ Auto-fix completed")
-    print(f"   Attempts: {fix_report['attempts']}")
-    print(f"   Initial Issues: {fix_report['initial_issues']}")
-    print(f"   Final Issues: {fix_report['final_issues']}")
-    print(f"   Success: {fix_report['success']}")
-    print(f"   Fixes Applied: {len(fix_report['fixes_applied'])}")
-    
-    print()
-    
-except Exception as e:
-    print(f"❌ Auto-fix failed: {e}\n")
-    import traceback
-    traceback.print_exc()
-
-# Test 5: Generate human-readable summary
-print("Test 5: Generating fix summary...")
-try:
-    summary = generate_fix_summary(fix_report)
-    
-    print("✅ Summary generated\n")
-    print(summary)
-    print()
-    
-except Exception as e:
-    print(f"❌ Summary generation failed: {e}\n")
-
-# Test 6: Integration test with a real file
-print("\nTest 6: Testing file-based fixing...")
-try:
-    from pathlib import Path
-    
-    # Create test file
-    test_file = Path("dist/fixer_test.html")
-    test_file.parent.mkdir(exist_ok=True)
-    
-    with open(test_file, 'w', encoding='utf-8') as f:
-        f.write("""
+        print(f"   {_STATUS[bool(check)]} {description}")
+
+
+def main():
+    """Run all fixer checks, recording failures in FAILED."""
+    print("\n".join([
+        BAR,
+        "🔧 FIXER MODULE - COMPREHENSIVE VERIFICATION",
+        BAR + "\n"
+    ]))
+
+    # Test 1: Import check
+    print("Test 1: Importing fixer functions...")
+    try:
+        from src.fixer import (
+            analyze_issues,
+            apply_fixes,
+            auto_fix_website,
+            fix_from_file,
+            generate_fix_summary
+        )
+        from src.verify_utils import print_error
+        print("✅ All functions imported successfully\n")
+    except ImportError as e:
+        print(f"❌ Import failed: {e}\n")
+        # Nothing else can run without the module
+        FAILED.append("test_1_import")
+        return
+
+    # Test 2: Analyze various issue types
+    print("Test 2: Testing issue analysis...")
+    actions = None
+    try:
+        actions = analyze_issues(TEST_REPORT)
+
+        print(f"✅ Analyzed {len(TEST_REPORT['issues'])} issues")
+        print(f"   Generated {len(actions)} fix actions:")
+
+        for i, action in enumerate(actions[:5], 1):
+            print(f"   {i}. {action['type']} (Priority {action.get('priority', 'N/A')})")
+
+        print()
+
+    except Exception as e:
+        print(f"❌ Analysis failed: {e}\n")
+        FAILED.append("test_2_analyze_issues")
+
+    # Test 3: Apply fixes to problematic HTML
+    print("Test 3: Applying fixes to problematic HTML...")
+    if actions is None:
+        print("⚠️  Skipped - needs the fix actions from Test 2\n")
+    else:
+        try:
+            fixed_html, applied_fixes = apply_fixes(PROBLEMATIC_HTML, actions)
+
+            print(f"✅ Applied {len(applied_fixes)} fixes:")
+            for fix in applied_fixes:
+                print(f"   ✓ {fix}")
+
+            # Verify fixes were actually applied (structurally, not by substring)
+            tree = lxml.html.fromstring(fixed_html)
+            checks = head_and_alt_checks(fixed_html) + [
+                (tree.xpath('boolean(//style[contains(., "overflow-x") or contains(., "max-width")])'),
+                 "Overflow fix applied")
+            ]
+            print_checks(checks)
+
+            if not all(check for check, _ in checks):
+                FAILED.append("test_3_apply_fixes")
+
+            print()
+
+        except Exception as e:
+            print(f"❌ Fix application failed: {e}\n")
+            print_error(e)
+            FAILED.append("test_3_apply_fixes")
+
+    # Test 4: Full auto-fix workflow
+    print("Test 4: Testing full auto-fix workflow...")
+    fix_report = None
+    try:
+        test_html = """
         <!DOCTYPE html>
         <html>
         <head></head>
-        <body>
-            <h1>File Test</h1>
+        <body style="height: 500px;">
+            <h1>Short Page</h1>
             <img src="test.jpg">
         </body>
         </html>
-        """)
-    
-    # Fix the file
-    file_fix_report = fix_from_file(str(test_file), max_attempts=2)
-    
-    print(f"✅ File fixed successfully")
-    print(f"   Input: {test_file.name}")
-    print(f"   Output: {Path(file_fix_report['output_path']).name}")
-    print(f"   Fixes Applied: {len(file_fix_report['fixes_applied'])}")
-    
-    # Cleanup
-    test_file.unlink()
-    if Path(file_fix_report['output_path']).exists():
-        Path(file_fix_report['output_path']).unlink()
-    
-    print()
-    
-except Exception as e:
-    print(f"❌ File fixing failed: {e}\n")
-    import traceback
-    traceback.print_exc()
-
-# Final summary
-print("\n" + "="*70)
-print("🎉 FIXER MODULE VERIFICATION COMPLETE")
-print("="*70)
-print("\n✅ All core functions working correctly")
-print("✅ BeautifulSoup4 integration successful")
-print("✅ Issue analysis and prioritization functional")
-print("✅ Fix application working for all issue types")
-print("✅ Auto-fix iteration working")
-print("✅ File I/O operations working")
-print("✅ Ready for integration with Output Manager\n")
+        """
+
+        fixed_html, fix_report = auto_fix_website(test_html, max_attempts=2)
+
+        print("✅ Auto-fix completed")
+        print(f"   Attempts: {fix_report['attempts']}")
+        print(f"   Initial Issues: {fix_report['initial_issues']}")
+        print(f"   Final Issues: {fix_report['final_issues']}")
+        print(f"   Success: {fix_report['success']}")
+        print(f"   Fixes Applied: {len(fix_report['fixes_applied'])}")
+
+        print()
+
+    except Exception as e:
+        print(f"❌ Auto-fix failed: {e}\n")
+        print_error(e)
+        FAILED.append("test_4_auto_fix")
+
+    # Test 5: Generate human-readable summary
+    print("Test 5: Generating fix summary...")
+    if fix_report is None:
+        print("⚠️  Skipped - needs the fix report from Test 4\n")
+    else:
+        try:
+            summary = generate_fix_summary(fix_report)
+
+            print("✅ Summary generated\n")
+            print(summary)
+            print()
+
+        except Exception as e:
+            print(f"❌ Summary generation failed: {e}\n")
+            FAILED.append("test_5_fix_summary")
+
+    # Test 6: Integration test with a real file
+    print("\nTest 6: Testing file-based fixing...")
+    if actions is None:
+        print("⚠️  Skipped - needs the fix actions from Test 2\n")
+        return
+    try:
+        from pathlib import Path
+
+        # Check fixed content in memory; the file round-trip only checks I/O
+        fixed_file_html, file_applied = apply_fixes(UNTITLED_HTML, actions)
+
+        # Create test file
+        test_file = Path("dist/fixer_test.html")
+        test_file.parent.mkdir(exist_ok=True)
+        test_file.write_text(UNTITLED_HTML, encoding='utf-8')
+
+        # Fix the file
+        file_fix_report = fix_from_file(str(test_file), max_attempts=2)
+        output_file = Path(file_fix_report['output_path'])
+
+        print(f"✅ File fixed successfully")
+        print(f"   Input: {test_file.name}")
+        print(f"   Output: {output_file.name} (exists: {output_file.exists()})")
+        print(f"   Fixes Applied: {len(file_fix_report['fixes_applied'])}")
+        print(f"   In-memory Fixes: {len(file_applied)}")
+
+        checks = head_and_alt_checks(fixed_file_html)
+        print_checks(checks)
+
+        if not output_file.exists() or not all(check for check, _ in checks):
+            FAILED.append("test_6_fix_from_file")
+
+        # Cleanup
+        test_file.unlink()
+        output_file.unlink(missing_ok=True)
+
+        print()
+
+    except Exception as e:
+        print(f"❌ File fixing failed: {e}\n")
+        print_error(e)
+        FAILED.append("test_6_fix_from_file")
+
+
+if __name__ == "__main__":
+    main()
+
+    # Final summary
+    if FAILED:
+        print("\n".join([
+            "\n" + BAR,
+            f"⚠️  FIXER MODULE VERIFICATION: {len(FAILED)} FAILED",
+            BAR,
+            *(f"   ❌ {name}" for name in FAILED),
+            ""
+        ]))
+    else:
+        print("\n".join([
+            "\n" + BAR,
+            "🎉 FIXER MODULE VERIFICATION COMPLETE",
+            BAR,
+            "\n✅ All core functions working correctly",
+            "✅ BeautifulSoup4 integration successful",
+            "✅ Issue analysis and prioritization functional",
+            "✅ Fix application working for all issue types",
+            "✅ Auto-fix iteration working",
+            "✅ File I/O operations working",
+            "✅ Ready for integration with Output Manager\n"
+        ]))
+
+    # Machine-readable line for CI log parsers
+    print(json.dumps({"failed": FAILED}))
+    sys.exit(1 if FAILED else 0)
@@ -3,9 +3,11 @@
 Comprehensive verification of Output Manager
 """
 
-print("="*70)
-print("📦 OUTPUT MANAGER - COMPREHENSIVE VERIFICATION")
-print("="*70 + "\n")
+print("\n".join([
+    "="*70,
+    "📦 OUTPUT MANAGER - COMPREHENSIVE VERIFICATION",
+    "="*70 + "\n"
+]))
 
 # Test 1: Import check
 print("Test 1: Importing output manager functions...")
@@ -20,6 +22,7 @@ try:
         create_deployment_package,
         clean_dist
     )
+    from src.verify_utils import print_error
     print("✅ All functions imported successfully\n")
 except ImportError as e:
     print(f"❌ Import failed: {e}\n")
@@ -134,8 +137,7 @@ try:
     
 except Exception as e:
     print(f"❌ Summary generation failed: {e}\n")
-    import traceback
-    traceback.print_exc()
+    print_error(e)
 
 # Test 5: Create deployment package
 print("\nTest 5: Creating deployment package...")
@@ -174,8 +176,7 @@ try:
         
 except Exception as e:
     print(f"❌ Deployment package failed: {e}\n")
-    import traceback
-    traceback.print_exc()
+    print_error(e)
 
 # Test 6: Export as ZIP
 print("Test 6: Exporting dist as ZIP...")
@@ -212,13 +213,15 @@ except Exception as e:
     print(f"❌ Assets check failed: {e}\n")
 
 # Final summary
-print("="*70)
-print("🎉 OUTPUT MANAGER VERIFICATION COMPLETE")
-print("="*70)
-print("\n✅ All core functions working correctly")
-print("✅ File save/load operations functional")
-print("✅ Build summaries generating properly")
-print("✅ Deployment package creation working")
-print("✅ ZIP export functional")
-print("✅ File management operations working")
-print("✅ Ready for final orchestration\n")
+print("\n".join([
+    "="*70,
+    "🎉 OUTPUT MANAGER VERIFICATION COMPLETE",
+    "="*70,
+    "\n✅ All core functions working correctly",
+    "✅ File save/load operations functional",
+    "✅ Build summaries generating properly",
+    "✅ Deployment package creation working",
+    "✅ ZIP export functional",
+    "✅ File management operations working",
+    "✅ Ready for final orchestration\n"
+]))
@@ -3,12 +3,14 @@ Debug Gemini API Connection
 """
 import os
 import sys
+import time
 from pathlib import Path
 
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
 from dotenv import load_dotenv
+from src.verify_utils import print_error
 load_dotenv()
 
 # Test 1: Check API key
@@ -28,7 +30,8 @@ except Exception as e:
 # Test 3: Configure Gemini
 print("\nTest 3: Configure Gemini")
 try:
-    genai.configure(api_key=api_key)
+    from src.gemini_client import configure
+    configure(api_key)
     print("  ✅ Configuration successful")
 except Exception as e:
     print(f"  ❌ Configuration failed: {e}")
@@ -37,21 +40,40 @@ except Exception as e:
 # Test 4: Initialize Model
 print("\nTest 4: Initialize Model")
 try:
-    model = genai.GenerativeModel('gemini-2.0-flash-exp')
+    from src.gemini_client import get_model
+    model = get_model('gemini-2.0-flash-exp')
     print("  ✅ Model initialized")
 except Exception as e:
     print(f"  ❌ Model initialization failed: {e}")
     sys.exit(1)
 
+
+def stream_generate(prompt):
+    """
+    Stream a generation and time it.
+    
+    Returns:
+        Tuple of (full text, first-chunk latency in seconds, total seconds)
+    """
+    chunks = []
+    first = None
+    t0 = time.monotonic()
+    for chunk in model.generate_content(prompt, stream=True):
+        if first is None:
+            first = time.monotonic() - t0
+        chunks.append(chunk.text)
+    return "".join(chunks), first or 0.0, time.monotonic() - t0
+
+
 # Test 5: Simple Generation
 print("\nTest 5: Test Simple Generation")
 try:
-    response = model.generate_content("Say hello in one sentence")
-    print(f"  ✅ Response: {response.text[:100]}")
+    text, first, total = stream_generate("Say hello in one sentence")
+    print(f"  ✅ Response: {text[:100]}")
+    print(f"  First token: {first*1000:.0f}ms, total: {total:.2f}s")
 except Exception as e:
     print(f"  ❌ Generation failed: {e}")
-    import traceback
-    traceback.print_exc()
+    print_error(e)
     sys.exit(1)
 
 # Test 6: Component Generation
@@ -62,14 +84,13 @@ try:
 - Links: Home, About, Contact
 Return ONLY the HTML, no explanations."""
     
-    response = model.generate_content(prompt)
-    html = response.text
+    html, first, total = stream_generate(prompt)
     print(f"  ✅ Generated {len(html)} characters")
+    print(f"  First token: {first*1000:.0f}ms, total: {total:.2f}s")
     print(f"  Preview: {html[:200]}...")
 except Exception as e:
     print(f"  ❌ Component generation failed: {e}")
-    import traceback
-    traceback.print_exc()
+    print_error(e)
     sys.exit(1)
 
 print("\n✅ All tests passed!")
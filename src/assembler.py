@@ -13,10 +13,22 @@ Responsibilities:
 Output: Complete HTML file ready for validation
 """
 
-from jinja2 import Template
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import hashlib
+import logging
+from jinja2 import Environment, Template
 from pathlib import Path
-from typing import Dict, List, Optional
-import re
+import sys
+import threading
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Optional Rust-backed Jinja-compatible engine for component rendering
+try:
+    import minijinja
+except ImportError:
+    minijinja = None
 
 
 # Framework CDN links
@@ -51,21 +63,57 @@ FRAMEWORK_CDN = {
     }
 }
 
-# HTML template structure
-HTML_TEMPLATE = """<!DOCTYPE html>
+log = logging.getLogger(__name__)
+
+# Shared Jinja2 environment for every template in this module. Autoescaping
+# stays off: placeholders are filled with trusted markup (head content,
+# rendered components), as with the plain Template() objects used before.
+_ENV = Environment(autoescape=False, cache_size=-1, auto_reload=False)
+
+# MiniJinja environment for component templates when available. Templates
+# are registered under extension-less names, so they are not autoescaped,
+# matching _ENV.
+_MJ_ENV = minijinja.Environment() if minijinja is not None else None
+
+# Names of component sources registered with _MJ_ENV, oldest first
+MJ_TEMPLATE_CACHE_SIZE = 256
+_MJ_TEMPLATES: "OrderedDict[str, None]" = OrderedDict()
+_MJ_LOCK = threading.Lock()
+
+# Upper bound on threads used to read and render components in parallel
+MAX_RENDER_WORKERS = 8
+
+# File-based component contents keyed by component path: (st_mtime_ns, content)
+_COMPONENT_CACHE: Dict[str, Tuple[int, str]] = {}
+
+# HTML template structure (str.format syntax; filled by format_map).
+# Split around the body so pages can be streamed section by section.
+_OUTER_PREFIX = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{{ page_title }}</title>
-    {{ head_content }}
+    <title>{page_title}</title>
+    {head_content}
 </head>
-<body class="{{ body_class }}">
-    {{ body_content }}
-    {{ footer_scripts }}
+<body class="{body_class}">
+    """
+_OUTER_SUFFIX = """
+    {footer_scripts}
 </body>
 </html>
 """
+HTML_TEMPLATE = _OUTER_PREFIX + "{body_content}" + _OUTER_SUFFIX
+
+# Placed between rendered components in the page body
+_SECTION_SEPARATOR = "\n\n    "
+
+
+class _SafeDict(dict):
+    """Mapping for HTML_TEMPLATE.format_map that leaves missing keys empty."""
+
+    def __missing__(self, key):
+        return ""
 
 
 def read_component(component_path: str) -> str:
@@ -114,19 +162,59 @@ def read_component(component_path: str) -> str:
     project_root = Path(__file__).parent.parent
     full_path = project_root / component_path
     
-    if not full_path.exists():
+    try:
+        mtime = full_path.stat().st_mtime_ns
+    except FileNotFoundError:
         raise FileNotFoundError(f"Component file not found: {component_path}")
     
+    # Re-read only if the file changed since it was cached
+    cached = _COMPONENT_CACHE.get(component_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    
     with open(full_path, 'r', encoding='utf-8') as f:
         content = f.read()
     
+    _COMPONENT_CACHE[component_path] = (mtime, content)
     return content
 
 
+def clear_component_cache():
+    """Forget cached component file contents."""
+    _COMPONENT_CACHE.clear()
+
+
+@lru_cache(maxsize=256)
+def _compile_template(component_html: str) -> Template:
+    """Compile component HTML once; later renders of the same source reuse it."""
+    return _ENV.from_string(component_html)
+
+
+def _mj_template_name(component_html: str) -> str:
+    """Register component HTML with MiniJinja once and return its name."""
+    name = "component-" + hashlib.sha1(component_html.encode("utf-8")).hexdigest()
+    
+    with _MJ_LOCK:
+        if name in _MJ_TEMPLATES:
+            _MJ_TEMPLATES.move_to_end(name)
+            return name
+        
+        _MJ_ENV.add_template(name, component_html)
+        _MJ_TEMPLATES[name] = None
+        if len(_MJ_TEMPLATES) > MJ_TEMPLATE_CACHE_SIZE:
+            oldest, _ = _MJ_TEMPLATES.popitem(last=False)
+            _MJ_ENV.remove_template(oldest)
+    
+    return name
+
+
 def fill_placeholders(component_html: str, data: dict) -> str:
     """
     Replace placeholders in component with actual data using Jinja2.
     
+    Uses MiniJinja when installed, falling back to Jinja2 for templates
+    it cannot render.
+    
     Args:
         component_html: Component HTML with placeholders
         data: Dictionary of values to fill in
@@ -134,12 +222,18 @@ def fill_placeholders(component_html: str, data: dict) -> str:
     Returns:
         Component HTML with filled placeholders
     """
+    if _MJ_ENV is not None:
+        try:
+            return _MJ_ENV.render_template(_mj_template_name(component_html), **data)
+        except minijinja.TemplateError as e:
+            log.debug("MiniJinja could not render template, using Jinja2: %s", e)
+    
     try:
-        template = Template(component_html)
+        template = _compile_template(component_html)
         rendered = template.render(**data)
         return rendered
     except Exception as e:
-        print(f"⚠️  Warning: Error rendering template: {e}")
+        log.warning("⚠️  Warning: Error rendering template: %s", e)
         return component_html
 
 
@@ -159,43 +253,130 @@ def assemble_website(
     Returns:
         Complete HTML document as string
     """
+    return "".join(assemble_website_stream(component_map, intent, custom_data))
+
+
+def assemble_website_stream(
+    component_map: dict, 
+    intent: dict,
+    custom_data: Optional[dict] = None
+) -> Iterator[str]:
+    """
+    Combine all components into a complete website, yielding it in chunks.
+    
+    Yields the document head, then each rendered component in component_map
+    order as soon as it is ready, then the closing scripts and tags. Joining
+    the chunks gives the same document as assemble_website().
+    
+    Args:
+        component_map: Mapping of sections to component paths
+        intent: Original parsed intent with metadata
+        custom_data: Optional custom data for template rendering
+        
+    Yields:
+        Consecutive pieces of the HTML document
+    """
     # Prepare template data
     template_data = _prepare_template_data(intent, custom_data)
     
-    # Load and render all components
-    rendered_components = []
-    for section, component_path in component_map.items():
+    # Get framework-specific head content
+    framework = intent.get("framework", "tailwind")
+    shell = _SafeDict(
+        page_title=template_data.get("page_title", "My Website"),
+        head_content=_get_framework_head(framework, template_data),
+        footer_scripts=_get_framework_scripts(framework),
+        body_class=_get_body_class(intent)
+    )
+    
+    yield _OUTER_PREFIX.format_map(shell)
+    
+    # Load and render all components; sections are independent, so reads
+    # (disk, AI cache or online fetch) overlap across threads
+    def _render_section(item):
+        section, component_path = item
         try:
             # Read component
             component_html = read_component(component_path)
             
             # Render with template data
-            rendered = fill_placeholders(component_html, template_data)
-            rendered_components.append(rendered)
-            
+            return fill_placeholders(component_html, template_data), None
         except Exception as e:
-            print(f"⚠️  Warning: Failed to load component '{section}': {e}")
-            continue
-    
-    # Combine all components
-    body_content = "\n\n    ".join(rendered_components)
-    
-    # Get framework-specific head content
-    framework = intent.get("framework", "tailwind")
-    head_content = _get_framework_head(framework, template_data)
-    footer_scripts = _get_framework_scripts(framework)
+            return None, e
     
-    # Build final HTML
-    page_title = template_data.get("page_title", "My Website")
-    body_class = _get_body_class(intent)
+    items = list(component_map.items())
+    executor = None
+    if len(items) > 1:
+        executor = ThreadPoolExecutor(max_workers=min(MAX_RENDER_WORKERS, len(items)))
+        results = executor.map(_render_section, items)
+    else:
+        results = map(_render_section, items)
     
-    final_html = HTML_TEMPLATE.replace("{{ page_title }}", page_title)
-    final_html = final_html.replace("{{ head_content }}", head_content)
-    final_html = final_html.replace("{{ body_content }}", body_content)
-    final_html = final_html.replace("{{ footer_scripts }}", footer_scripts)
-    final_html = final_html.replace("{{ body_class }}", body_class)
-    
-    return final_html
+    # Keep component_map order; report failures in that order too
+    try:
+        first = True
+        for (section, _), (rendered, error) in zip(items, results):
+            if error is not None:
+                log.warning("⚠️  Warning: Failed to load component '%s': %s", section, error)
+                continue
+            if not first:
+                yield _SECTION_SEPARATOR
+            first = False
+            yield rendered
+    finally:
+        # Don't render the remaining sections if the caller stops early
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+    
+    yield _OUTER_SUFFIX.format_map(shell)
+
+
+# Template values that don't depend on the intent
+_STATIC_TEMPLATE_DEFAULTS = {
+    # Hero section
+    "hero_subtitle": "Build amazing things with our powerful tools",
+    
+    # Features
+    "features_title": "Our Features",
+    "features_subtitle": "Everything you need to succeed",
+    
+    # Gallery
+    "gallery_title": "Our Work",
+    "gallery_subtitle": "Check out our latest projects",
+    
+    # Testimonials
+    "testimonials_title": "What Our Clients Say",
+    "testimonials_subtitle": "Don't just take our word for it",
+    
+    # Pricing
+    "pricing_title": "Simple Pricing",
+    "pricing_subtitle": "Choose the plan that's right for you",
+    
+    # Contact
+    "contact_title": "Get In Touch",
+    "contact_subtitle": "We'd love to hear from you",
+    "contact_email": "hello@example.com",
+    "contact_phone": "+1 (555) 123-4567",
+    "contact_location": "San Francisco, CA",
+    
+    # About
+    "about_title": "About Us",
+    "about_text": "We are a team of passionate individuals dedicated to creating exceptional digital experiences.",
+    
+    # CTA
+    "cta_title": "Ready to Get Started?",
+    "cta_subtitle": "Join thousands of satisfied customers today",
+    "cta_primary_button": "Get Started Now",
+    "cta_secondary_button": "Learn More",
+}
+
+
+# Template values derived from the intent on each call
+_DERIVED_TEMPLATE_KEYS = ("brand_name", "page_title", "primary_color", "secondary_color", "hero_title")
+
+# Every default key, derived ones as None placeholders, so each per-call
+# copy is allocated at full size and filling it in never resizes the dict
+_TEMPLATE_DEFAULTS = dict.fromkeys(_DERIVED_TEMPLATE_KEYS)
+_TEMPLATE_DEFAULTS.update(_STATIC_TEMPLATE_DEFAULTS)
 
 
 def _prepare_template_data(intent: dict, custom_data: Optional[dict] = None) -> dict:
@@ -211,55 +392,27 @@ def _prepare_template_data(intent: dict, custom_data: Optional[dict] = None) ->
     """
     metadata = intent.get("metadata", {})
     colors = intent.get("colors", ["blue", "white"])
-    style = intent.get("style", "modern")
     
-    # Default template data
-    data = {
-        # Brand/Identity
-        "brand_name": metadata.get("brand_name", "YourBrand"),
-        "page_title": metadata.get("brand_name", "My Website"),
-        
-        # Colors
-        "primary_color": colors[0] if colors else "blue",
-        "secondary_color": colors[1] if len(colors) > 1 else "purple",
-        
-        # Hero section
-        "hero_title": f"Welcome to {metadata.get('brand_name', 'Our Platform')}",
-        "hero_subtitle": "Build amazing things with our powerful tools",
-        
-        # Features
-        "features_title": "Our Features",
-        "features_subtitle": "Everything you need to succeed",
-        
-        # Gallery
-        "gallery_title": "Our Work",
-        "gallery_subtitle": "Check out our latest projects",
-        
-        # Testimonials
-        "testimonials_title": "What Our Clients Say",
-        "testimonials_subtitle": "Don't just take our word for it",
-        
-        # Pricing
-        "pricing_title": "Simple Pricing",
-        "pricing_subtitle": "Choose the plan that's right for you",
-        
-        # Contact
-        "contact_title": "Get In Touch",
-        "contact_subtitle": "We'd love to hear from you",
-        "contact_email": "hello@example.com",
-        "contact_phone": "+1 (555) 123-4567",
-        "contact_location": "San Francisco, CA",
-        
-        # About
-        "about_title": "About Us",
-        "about_text": "We are a team of passionate individuals dedicated to creating exceptional digital experiences.",
-        
-        # CTA
-        "cta_title": "Ready to Get Started?",
-        "cta_subtitle": "Join thousands of satisfied customers today",
-        "cta_primary_button": "Get Started Now",
-        "cta_secondary_button": "Learn More",
-    }
+    data = _TEMPLATE_DEFAULTS.copy()
+    custom = custom_data or {}
+    
+    # Values derived from the intent, only computed when not overridden
+    
+    # Brand/Identity
+    if "brand_name" not in custom:
+        data["brand_name"] = metadata.get("brand_name", "YourBrand")
+    if "page_title" not in custom:
+        data["page_title"] = metadata.get("brand_name", "My Website")
+    
+    # Colors
+    if "primary_color" not in custom:
+        data["primary_color"] = colors[0] if colors else "blue"
+    if "secondary_color" not in custom:
+        data["secondary_color"] = colors[1] if len(colors) > 1 else "purple"
+    
+    # Hero section
+    if "hero_title" not in custom:
+        data["hero_title"] = f"Welcome to {metadata.get('brand_name', 'Our Platform')}"
     
     # Apply custom data if provided
     if custom_data:
@@ -279,7 +432,18 @@ def _get_framework_head(framework: str, template_data: dict) -> str:
     Returns:
         HTML content for <head> section
     """
-    framework_info = FRAMEWORK_CDN.get(framework, FRAMEWORK_CDN["tailwind"])
+    try:
+        return FRAMEWORK_HEAD_CACHE[framework]
+    except KeyError:
+        return _build_framework_head(framework)
+
+
+def _build_framework_head(framework: str) -> str:
+    """Build the <head> content for a framework from FRAMEWORK_CDN."""
+    try:
+        framework_info = FRAMEWORK_CDN[framework]
+    except KeyError:
+        framework_info = FRAMEWORK_CDN["tailwind"]
     head_parts = []
     
     # Add CSS
@@ -318,6 +482,14 @@ def _get_framework_scripts(framework: str) -> str:
     Returns:
         HTML script tags for footer
     """
+    try:
+        return FRAMEWORK_SCRIPTS_CACHE[framework]
+    except KeyError:
+        return ""
+
+
+def _build_framework_scripts(framework: str) -> str:
+    """Build the footer script tags for a framework from FRAMEWORK_CDN."""
     framework_info = FRAMEWORK_CDN.get(framework, {})
     
     if "js" in framework_info:
@@ -326,6 +498,25 @@ def _get_framework_scripts(framework: str) -> str:
     return ""
 
 
+# Head and footer markup depend only on the framework, so build them once
+FRAMEWORK_HEAD_CACHE = {name: _build_framework_head(name) for name in FRAMEWORK_CDN}
+FRAMEWORK_SCRIPTS_CACHE = {name: _build_framework_scripts(name) for name in FRAMEWORK_CDN}
+
+
+# Map styles to body classes; interned so every page shares the same strings
+_DEFAULT_BODY_CLASS = sys.intern("bg-white text-gray-900")
+_STYLE_CLASSES = {
+    style: sys.intern(classes) for style, classes in {
+        "dark": "dark bg-gray-900 text-white",
+        "minimal": "bg-white text-gray-900",
+        "modern": "bg-white text-gray-900",
+        "retro": "bg-gray-100 text-gray-900",
+        "corporate": "bg-white text-gray-900",
+        "creative": "bg-white text-gray-900"
+    }.items()
+}
+
+
 def _get_body_class(intent: dict) -> str:
     """
     Get body CSS class based on intent style.
@@ -336,19 +527,7 @@ def _get_body_class(intent: dict) -> str:
     Returns:
         CSS class string for body tag
     """
-    style = intent.get("style", "modern")
-    
-    # Map styles to potential body classes
-    style_classes = {
-        "dark": "dark bg-gray-900 text-white",
-        "minimal": "bg-white text-gray-900",
-        "modern": "bg-white text-gray-900",
-        "retro": "bg-gray-100 text-gray-900",
-        "corporate": "bg-white text-gray-900",
-        "creative": "bg-white text-gray-900"
-    }
-    
-    return style_classes.get(style, "bg-white text-gray-900")
+    return _STYLE_CLASSES.get(intent.get("style", "modern"), _DEFAULT_BODY_CLASS)
 
 
 def create_standalone_page(
@@ -0,0 +1,171 @@
+"""
+Cache Module
+Reuses parsed intents across builds.
+
+Responsibilities:
+- Memoize parse_intent() per prompt in an in-process LRU
+- Persist AI-assisted intents to disk, so a repeated prompt skips the
+  Gemini section-selection call in later runs too
+- Report hit/miss counts for the build summary and debugging
+
+Keyword-only parsing is cheaper than a file read, so those intents are
+kept in memory only. Disk entries are keyed on the parser's keyword tables
+and INTENT_CACHE_VERSION, and expire after INTENT_CACHE_TTL seconds, so
+they don't outlive changes to the parser or the model's answers. The
+component registry has its own mtime-checked cache in component_mapper.
+"""
+
+import copy
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Tuple
+
+from src import intent_parser
+from src.intent_parser import parse_intent_with_source
+
+INTENT_CACHE_DIR = Path(os.getenv("INTENT_CACHE_DIRECTORY", ".cache/intent"))
+INTENT_CACHE_SIZE = 256
+INTENT_CACHE_TTL = int(os.getenv("INTENT_CACHE_TTL", 7 * 24 * 60 * 60))  # Seconds
+
+# Bump when the intent format changes in a way the keyword tables don't show
+INTENT_CACHE_VERSION = 1
+
+# Part of every disk cache key, so editing the parser's tables orphans old entries
+_INTENT_SCHEMA = f"{INTENT_CACHE_VERSION}:" + hashlib.sha1(json.dumps([
+    intent_parser.SECTION_KEYWORDS,
+    intent_parser.FRAMEWORK_KEYWORDS,
+    intent_parser.STYLE_KEYWORDS,
+    intent_parser.SECTION_ORDER,
+    intent_parser.COLOR_KEYWORDS,
+    intent_parser.METADATA_KEYWORDS,
+], sort_keys=True).encode("utf-8")).hexdigest()
+
+# Recently used intents ((prompt hash, ai) -> intent), in front of the disk
+# cache; least recently used entries are evicted beyond INTENT_CACHE_SIZE
+_MEMORY_CACHE: "OrderedDict[Tuple[str, bool], dict]" = OrderedDict()
+
+# Hits from memory and disk, and parses run from scratch
+_STATS = {"hits": 0, "disk_hits": 0, "misses": 0}
+
+# Guards _MEMORY_CACHE and _STATS
+_CACHE_LOCK = threading.Lock()
+
+
+def _count(stat: str):
+    """Increment an intent cache counter."""
+    with _CACHE_LOCK:
+        _STATS[stat] += 1
+
+
+def cached_parse_intent(user_prompt: str, use_ai: bool = True) -> dict:
+    """
+    Parse a prompt, reusing the result of an earlier identical parse.
+    
+    Args:
+        user_prompt: Natural language description of desired website
+        use_ai: Whether to use AI for intelligent section selection
+    
+    Returns:
+        Intent dictionary, as returned by parse_intent(); a fresh copy each
+        call, so callers may modify it
+    """
+    # Whether AI will actually be used is part of the key, so a keyword-only
+    # intent isn't served once an API key is configured
+    ai = use_ai and intent_parser.AI_AVAILABLE
+    prompt_hash = hashlib.sha1(f"{_INTENT_SCHEMA}\0{user_prompt}".encode("utf-8")).hexdigest()
+    key = (prompt_hash, ai)
+    
+    with _CACHE_LOCK:
+        intent = _MEMORY_CACHE.get(key)
+        if intent is not None:
+            _MEMORY_CACHE.move_to_end(key)
+            _STATS["hits"] += 1
+    
+    if intent is None:
+        intent, reusable = _load_intent(prompt_hash, user_prompt, ai)
+        if reusable:
+            _remember_intent(key, intent)
+    
+    return copy.deepcopy(intent)
+
+
+def _load_intent(prompt_hash: str, user_prompt: str, ai: bool) -> Tuple[dict, bool]:
+    """
+    Parse an intent, checking the disk cache first for AI-assisted parses.
+    
+    Returns:
+        Tuple of (intent, whether it may be reused for later calls)
+    """
+    if not ai:
+        _count("misses")
+        return parse_intent_with_source(user_prompt, use_ai=False)[0], True
+    
+    cache_file = INTENT_CACHE_DIR / f"{prompt_hash}.json"
+    try:
+        if time.time() - cache_file.stat().st_mtime < INTENT_CACHE_TTL:
+            intent = json.loads(cache_file.read_text(encoding="utf-8"))
+            _count("disk_hits")
+            return intent, True
+    except (FileNotFoundError, ValueError):
+        pass
+    
+    _count("misses")
+    intent, ai_sections = parse_intent_with_source(user_prompt, use_ai=True)
+    
+    # A failed Gemini call (e.g. a 429 or a timeout) falls back to keywords;
+    # keep that out of both caches so the next call retries the AI
+    if ai_sections:
+        _write_intent(cache_file, intent)
+    return intent, ai_sections
+
+
+def _remember_intent(key: Tuple[str, bool], intent: dict):
+    """Store an intent in the in-memory cache, evicting the oldest if full."""
+    with _CACHE_LOCK:
+        _MEMORY_CACHE[key] = intent
+        _MEMORY_CACHE.move_to_end(key)
+        
+        while len(_MEMORY_CACHE) > INTENT_CACHE_SIZE:
+            _MEMORY_CACHE.popitem(last=False)
+
+
+def _write_intent(cache_file: Path, intent: dict):
+    """Write an intent to the disk cache; failures only cost a future re-parse."""
+    tmp_file = cache_file.with_suffix(f".{threading.get_ident()}.tmp")
+    try:
+        INTENT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_file.write_text(json.dumps(intent), encoding="utf-8")
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        tmp_file.unlink(missing_ok=True)
+
+
+def intent_cache_stats() -> dict:
+    """
+    Get intent cache statistics.
+    
+    Returns:
+        Dictionary with memory hits, disk hits, misses and current size
+    """
+    with _CACHE_LOCK:
+        stats = dict(_STATS)
+        stats["size"] = len(_MEMORY_CACHE)
+    return stats
+
+
+def clear_intent_cache():
+    """
+    Clear the in-memory and on-disk intent caches.
+    """
+    with _CACHE_LOCK:
+        _MEMORY_CACHE.clear()
+        _STATS.update(dict.fromkeys(_STATS, 0))
+    
+    if INTENT_CACHE_DIR.exists():
+        for cache_file in INTENT_CACHE_DIR.glob("*.json"):
+            cache_file.unlink(missing_ok=True)
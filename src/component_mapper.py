@@ -20,8 +20,13 @@ Example Registry:
 """
 
 import json
+import logging
 import os
 import random
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 from dotenv import load_dotenv
@@ -29,6 +34,8 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
+log = logging.getLogger(__name__)
+
 # Import AI generator
 try:
     from src.gemini_generator import (
@@ -40,6 +47,12 @@ try:
 except ImportError:
     AI_AVAILABLE = False
 
+# Optional faster JSON parser for the registry
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Import online component fetcher
 try:
     from src.online_component_fetcher import get_online_component, list_available_online_components
@@ -54,6 +67,31 @@ AI_FALLBACK = os.getenv("AI_FALLBACK_ENABLED", "true").lower() == "true"
 # Default component registry path
 REGISTRY_PATH = "components/component_registry.json"
 
+# Upper bound on threads listing component directories in validate_component_paths
+MAX_SCAN_WORKERS = 8
+
+# Registry and component paths are relative to the project root
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+_REGISTRY_FULL_PATH = _PROJECT_ROOT / REGISTRY_PATH
+
+# Parsed registries keyed by resolved path: ((st_mtime_ns, st_size), registry).
+# Shared by the internal lookups, which must not mutate it; the public
+# functions hand out copies.
+_REGISTRY_CACHE: Dict[str, Tuple[Tuple[int, int], dict]] = {}
+
+# Next round-robin index per section name; the lock keeps concurrent
+# builds from reading the same index and picking the same variant
+_RR_COUNTERS: Dict[str, int] = {}
+_RR_LOCK = threading.Lock()
+
+
+def _next_round_robin(components: List[str], section_name: str) -> str:
+    """Return the next component for section_name, rotating across calls."""
+    with _RR_LOCK:
+        index = _RR_COUNTERS.get(section_name, 0) % len(components)
+        _RR_COUNTERS[section_name] = index + 1
+    return components[index]
+
 
 def load_component_registry(registry_path: str = REGISTRY_PATH) -> dict:
     """
@@ -64,18 +102,58 @@ def load_component_registry(registry_path: str = REGISTRY_PATH) -> dict:
         
     Returns:
         Dictionary mapping frameworks and sections to component paths
+        (a fresh copy; the file is only re-parsed when it changes)
     """
-    # Get absolute path relative to project root
-    project_root = Path(__file__).parent.parent
-    full_path = project_root / registry_path
+    return _copy_registry(_load_registry_entry(registry_path)[1])
+
+
+def _load_registry_entry(registry_path: str) -> Tuple[Tuple[int, int], dict]:
+    """Return (file signature, registry), re-parsing only when the file changed."""
+    full_path = _registry_full_path(registry_path)
     
-    if not full_path.exists():
+    try:
+        stat = full_path.stat()
+    except FileNotFoundError:
         raise FileNotFoundError(f"Component registry not found at {full_path}")
     
-    with open(full_path, 'r', encoding='utf-8') as f:
-        registry = json.load(f)
+    # Re-parse only if the file changed since it was cached; the size catches
+    # rewrites that land within the filesystem's timestamp resolution
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cache_key = _registry_cache_key(full_path)
+    cached = _REGISTRY_CACHE.get(cache_key)
+    if cached is not None and cached[0] == signature:
+        return cached
     
-    return registry
+    if orjson is not None:
+        registry = orjson.loads(full_path.read_bytes())
+    else:
+        with open(full_path, 'r', encoding='utf-8') as f:
+            registry = json.load(f)
+    
+    entry = (signature, registry)
+    _REGISTRY_CACHE[cache_key] = entry
+    return entry
+
+
+def _copy_registry(registry: dict) -> dict:
+    """Copy a registry down to its component lists (the paths are immutable)."""
+    return {
+        framework: {section: list(components) for section, components in sections.items()}
+        for framework, sections in registry.items()
+    }
+
+
+def _registry_full_path(registry_path: str) -> Path:
+    """Absolute path of a registry file given relative to the project root."""
+    if registry_path == REGISTRY_PATH:
+        return _REGISTRY_FULL_PATH
+    return _PROJECT_ROOT / registry_path
+
+
+@lru_cache(maxsize=32)
+def _registry_cache_key(full_path: Path) -> str:
+    """Cache key for a registry file, so equivalent paths share one entry."""
+    return str(full_path.resolve())
 
 
 def map_sections_to_components(
@@ -171,27 +249,30 @@ def _get_component_from_registry(
     registry_path: str
 ) -> Optional[str]:
     """Get a single component from the registry."""
-    registry = load_component_registry(registry_path)
+    signature, _ = _load_registry_entry(registry_path)
     framework = intent.get("framework", "bootstrap")
     
-    if framework not in registry:
-        return None
-    
-    framework_components = registry[framework]
-    available_components = framework_components.get(section, [])
+    index = _flat_registry_index(registry_path, signature)
+    available_components = index.get((framework, section))
     
     if not available_components:
         return None
     
-    # Select component based on strategy
-    if selection_strategy == "random":
-        return random.choice(available_components)
-    elif selection_strategy == "round_robin":
-        # Simple round-robin (could be improved with state)
-        index = hash(section) % len(available_components)
-        return available_components[index]
-    else:  # "first" or default
-        return available_components[0]
+    return _select_component(available_components, selection_strategy, section)
+
+
+@lru_cache(maxsize=16)
+def _flat_registry_index(
+    registry_path: str,
+    signature: Tuple[int, int]
+) -> Dict[Tuple[str, str], List[str]]:
+    """Map (framework, section) -> component paths for one registry file version."""
+    registry = _load_registry_entry(registry_path)[1]
+    return {
+        (framework, section): components
+        for framework, sections in registry.items()
+        for section, components in sections.items()
+    }
 
 
 def _map_from_registry(
@@ -222,35 +303,78 @@ def _map_from_registry(
         return component_map
     
     # Traditional file-based approach for other frameworks
-    registry = load_component_registry(registry_path)
+    signature, registry = _load_registry_entry(registry_path)
     
     # Check if framework exists in registry
     if framework not in registry:
         raise ValueError(f"Framework '{framework}' not found in registry. Available: {list(registry.keys())}")
     
-    framework_components = registry[framework]
+    # "first" is deterministic, so repeated intents reuse the cached mapping
+    if selection_strategy == "first":
+        mapped, missing = _map_first_cached(
+            registry_path, signature, framework, tuple(sections)
+        )
+        for section in missing:
+            log.warning("⚠️  Warning: No %s component found for section '%s', skipping...", framework, section)
+        return dict(mapped)
+    
+    # Local bindings keep the per-section loop on fast local lookups
+    get_components = registry[framework].get
+    select = _select_component
     
     for section in sections:
         # Get available components for this section
-        available_components = framework_components.get(section, [])
+        available_components = get_components(section)
         
         if not available_components:
             # Try to find a fallback or skip
-            print(f"⚠️  Warning: No {framework} component found for section '{section}', skipping...")
+            log.warning("⚠️  Warning: No %s component found for section '%s', skipping...", framework, section)
             continue
         
         # Select component based on strategy
-        selected_component = _select_component(
-            available_components, 
-            selection_strategy,
-            section
-        )
-        
-        component_map[section] = selected_component
+        component_map[section] = select(available_components, selection_strategy, section)
     
     return component_map
 
 
+@lru_cache(maxsize=256)
+def _map_first_cached(
+    registry_path: str,
+    signature: Tuple[int, int],
+    framework: str,
+    sections: Tuple[str, ...]
+) -> Tuple[Tuple[Tuple[str, str], ...], Tuple[str, ...]]:
+    """
+    Map sections to their first registered component.
+    
+    The registry file signature is part of the key, so editing the registry
+    invalidates earlier results.
+    
+    Returns:
+        Tuple of ((section, component path) pairs, sections with no component)
+    """
+    get_components = _load_registry_entry(registry_path)[1][framework].get
+    mapped = []
+    missing = []
+    
+    for section in sections:
+        available_components = get_components(section)
+        if available_components:
+            mapped.append((section, available_components[0]))
+        else:
+            missing.append(section)
+    
+    return tuple(mapped), tuple(missing)
+
+
+# Selection strategies: (components, section_name) -> component path
+_STRATEGY_DISPATCH = {
+    "first": lambda components, section_name: components[0],
+    "random": lambda components, section_name: random.choice(components),
+    "round_robin": _next_round_robin,
+}
+
+
 def _select_component(
     components: List[str], 
     strategy: str,
@@ -270,21 +394,9 @@ def _select_component(
     if not components:
         raise ValueError("No components available to select from")
     
-    if strategy == "first":
-        return components[0]
-    
-    elif strategy == "random":
-        return random.choice(components)
-    
-    elif strategy == "round_robin":
-        # Simple round robin using hash of section name
-        # In production, you'd track state across calls
-        index = hash(section_name) % len(components)
-        return components[index]
-    
-    else:
-        # Default to first
-        return components[0]
+    # Unknown strategies default to first
+    select = _STRATEGY_DISPATCH.get(strategy, _STRATEGY_DISPATCH["first"])
+    return select(components, section_name)
 
 
 def get_available_components(
@@ -303,7 +415,7 @@ def get_available_components(
     Returns:
         Dictionary of section -> component paths
     """
-    registry = load_component_registry(registry_path)
+    registry = _load_registry_entry(registry_path)[1]
     
     if framework not in registry:
         return {}
@@ -311,9 +423,9 @@ def get_available_components(
     framework_components = registry[framework]
     
     if section:
-        return {section: framework_components.get(section, [])}
+        return {section: list(framework_components.get(section, []))}
     
-    return framework_components
+    return {name: list(components) for name, components in framework_components.items()}
 
 
 def validate_component_paths(registry_path: str = REGISTRY_PATH) -> Dict[str, List[str]]:
@@ -326,19 +438,37 @@ def validate_component_paths(registry_path: str = REGISTRY_PATH) -> Dict[str, Li
     Returns:
         Dictionary of framework -> list of missing component paths
     """
-    registry = load_component_registry(registry_path)
-    project_root = Path(__file__).parent.parent
+    registry = _load_registry_entry(registry_path)[1]
+    
+    full_paths = {
+        framework: [
+            (component_path, _PROJECT_ROOT / component_path)
+            for components in sections.values()
+            for component_path in components
+        ]
+        for framework, sections in registry.items()
+    }
+    
+    # List each component directory once instead of stat-ing every file;
+    # the scans are independent I/O, so they run on a small thread pool
+    parents = list({full_path.parent for paths in full_paths.values() for _, full_path in paths})
+    if len(parents) > 1:
+        workers = min(MAX_SCAN_WORKERS, (os.cpu_count() or 1) * 2, len(parents))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            dir_entries = dict(zip(parents, executor.map(_scan_directory, parents)))
+    else:
+        dir_entries = {parent: _scan_directory(parent) for parent in parents}
     
     missing_components = {}
     
-    for framework, sections in registry.items():
+    for framework, paths in full_paths.items():
         missing_in_framework = []
         
-        for section, components in sections.items():
-            for component_path in components:
-                full_path = project_root / component_path
-                if not full_path.exists():
-                    missing_in_framework.append(component_path)
+        for component_path, full_path in paths:
+            names = dir_entries[full_path.parent]
+            exists = full_path.exists() if names is None else full_path.name in names
+            if not exists:
+                missing_in_framework.append(component_path)
         
         if missing_in_framework:
             missing_components[framework] = missing_in_framework
@@ -346,6 +476,19 @@ def validate_component_paths(registry_path: str = REGISTRY_PATH) -> Dict[str, Li
     return missing_components
 
 
+def _scan_directory(directory: Path) -> Optional[frozenset]:
+    """Names of the entries in directory, or None if it can't be listed."""
+    try:
+        with os.scandir(directory) as entries:
+            return frozenset(e.name for e in entries)
+    except (FileNotFoundError, NotADirectoryError):
+        # No such directory, so nothing inside it exists
+        return frozenset()
+    except OSError:
+        # Unreadable directory; check its files one by one
+        return None
+
+
 def add_component_to_registry(
     framework: str,
     section: str,
@@ -364,8 +507,13 @@ def add_component_to_registry(
     Returns:
         True if successful, False otherwise
     """
+    full_path = _registry_full_path(registry_path)
+    tmp_path = full_path.with_name(full_path.name + ".tmp")
+    
     try:
-        registry = load_component_registry(registry_path)
+        # Edit a copy; the cached registry is shared with the selection
+        # indexes, so it is only replaced once the new file is in place
+        registry = _copy_registry(_load_registry_entry(registry_path)[1])
         
         # Initialize framework if it doesn't exist
         if framework not in registry:
@@ -379,17 +527,25 @@ def add_component_to_registry(
         if component_path not in registry[framework][section]:
             registry[framework][section].append(component_path)
         
-        # Save updated registry
-        project_root = Path(__file__).parent.parent
-        full_path = project_root / registry_path
+        # Save updated registry; write a temp file and swap it in so a
+        # crash mid-write never leaves a truncated registry behind
+        if orjson is not None:
+            tmp_path.write_bytes(orjson.dumps(registry, option=orjson.OPT_INDENT_2))
+        else:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(registry, f, indent=2)
+        os.replace(tmp_path, full_path)
         
-        with open(full_path, 'w', encoding='utf-8') as f:
-            json.dump(registry, f, indent=2)
+        stat = full_path.stat()
+        _REGISTRY_CACHE[_registry_cache_key(full_path)] = (
+            (stat.st_mtime_ns, stat.st_size), registry
+        )
         
         return True
     
     except Exception as e:
         print(f"Error adding component: {e}")
+        tmp_path.unlink(missing_ok=True)
         return False
 
 
@@ -401,24 +557,29 @@ def get_component_stats(registry_path: str = REGISTRY_PATH) -> Dict:
         registry_path: Path to component registry file
         
     Returns:
-        Dictionary with component statistics
+        Dictionary with component statistics (shared between calls until the
+        registry changes; do not mutate)
     """
-    registry = load_component_registry(registry_path)
+    signature, _ = _load_registry_entry(registry_path)
+    return _component_stats_cached(registry_path, signature)
+
+
+@lru_cache(maxsize=16)
+def _component_stats_cached(registry_path: str, signature: Tuple[int, int]) -> Dict:
+    """Compute get_component_stats once per registry file version."""
+    registry = _load_registry_entry(registry_path)[1]
     
-    stats = {
+    return {
         "frameworks": len(registry),
-        "framework_details": {}
-    }
-    
-    for framework, sections in registry.items():
-        total_components = sum(len(components) for components in sections.values())
-        stats["framework_details"][framework] = {
-            "sections": len(sections),
-            "total_components": total_components,
-            "sections_list": list(sections.keys())
+        "framework_details": {
+            framework: {
+                "sections": len(sections),
+                "total_components": sum(map(len, sections.values())),
+                "sections_list": list(sections)
+            }
+            for framework, sections in registry.items()
         }
-    
-    return stats
+    }
 
 
 # Test function for development
@@ -475,14 +636,19 @@ def test_component_mapper():
         print("  ✅ All component paths are valid!")
 
 
-# AI component cache (temporary storage)
-_AI_COMPONENT_CACHE = {}
+# AI component cache (temporary storage), least recently used evicted first
+_AI_COMPONENT_CACHE: "OrderedDict[str, Optional[str]]" = OrderedDict()
+MAX_AI_CACHE_SIZE = 256
 
 
 def _cache_ai_components_for_assembler(components: dict):
     """Cache AI-generated components for assembler to access."""
-    global _AI_COMPONENT_CACHE
-    _AI_COMPONENT_CACHE = components
+    for section, html in components.items():
+        _AI_COMPONENT_CACHE[section] = html
+        _AI_COMPONENT_CACHE.move_to_end(section)
+    
+    while len(_AI_COMPONENT_CACHE) > MAX_AI_CACHE_SIZE:
+        _AI_COMPONENT_CACHE.popitem(last=False)
 
 
 def get_ai_component(section: str) -> Optional[str]:
@@ -495,13 +661,15 @@ def get_ai_component(section: str) -> Optional[str]:
     Returns:
         HTML string or None
     """
-    return _AI_COMPONENT_CACHE.get(section)
+    html = _AI_COMPONENT_CACHE.get(section)
+    if html is not None:
+        _AI_COMPONENT_CACHE.move_to_end(section)
+    return html
 
 
 def clear_ai_cache():
     """Clear the AI component cache."""
-    global _AI_COMPONENT_CACHE
-    _AI_COMPONENT_CACHE = {}
+    _AI_COMPONENT_CACHE.clear()
 
 
 if __name__ == "__main__":
@@ -20,10 +20,103 @@ Fix Strategies:
 - Responsive: Add viewport meta tag, responsive CSS
 """
 
+import html
 import re
+import shutil
+from collections import UserDict
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 from bs4 import BeautifulSoup
+from bs4.element import Stylesheet
+
+
+# Use the C-based lxml parser when available, else the pure-Python one
+try:
+    import lxml
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+
+def _scroll_actions(description: str) -> List[dict]:
+    """Fixes for a page that can't scroll"""
+    return [{
+        "type": "add_min_height",
+        "target": "body",
+        "value": "100vh",
+        "reason": "Ensure page is scrollable",
+        "priority": 2
+    }]
+
+
+def _overflow_actions(description: str) -> List[dict]:
+    """Fixes for content overflowing the viewport"""
+    if "horizontal" in description:
+        return [{
+            "type": "fix_horizontal_overflow",
+            "target": "body",
+            "reason": "Prevent horizontal scrolling",
+            "priority": 1
+        }]
+    return []
+
+
+def _responsive_actions(description: str) -> List[dict]:
+    """Fixes for layouts that break on small screens"""
+    return [
+        {
+            "type": "add_viewport_meta",
+            "reason": "Enable responsive behavior",
+            "priority": 1
+        },
+        {
+            "type": "add_responsive_css",
+            "reason": "Ensure mobile compatibility",
+            "priority": 2
+        }
+    ]
+
+
+# Accessibility keywords, in the order their fixes are added
+_ACCESSIBILITY_KEYWORDS = (
+    ("title", lambda: {
+        "type": "add_title",
+        "value": "Generated Website",
+        "reason": "Add missing page title",
+        "priority": 2
+    }),
+    ("alt", lambda: {
+        "type": "add_alt_text",
+        "reason": "Add alt text to images",
+        "priority": 3
+    }),
+)
+
+
+def _accessibility_actions(description: str) -> List[dict]:
+    """Fixes for missing titles and alt text"""
+    return [make() for keyword, make in _ACCESSIBILITY_KEYWORDS if keyword in description]
+
+
+def _structure_actions(description: str) -> List[dict]:
+    """Fixes for pages with too little structure"""
+    if "few sections" in description:
+        return [{
+            "type": "verify_structure",
+            "reason": "Check page structure",
+            "priority": 3
+        }]
+    return []
+
+
+# Issue type -> function turning the lowercased description into fix actions
+_ISSUE_HANDLERS = {
+    "scroll": _scroll_actions,
+    "overflow": _overflow_actions,
+    "responsive": _responsive_actions,
+    "accessibility": _accessibility_actions,
+    "structure": _structure_actions,
+}
 
 
 def analyze_issues(validation_report: dict) -> List[dict]:
@@ -39,63 +132,10 @@ def analyze_issues(validation_report: dict) -> List[dict]:
     fix_actions = []
     
     for issue in validation_report.get("issues", []):
-        issue_type = issue.get("type", "")
-        severity = issue.get("severity", "")
-        description = issue.get("description", "")
-        
-        # Analyze and create fix actions based on issue type
-        if issue_type == "scroll":
-            fix_actions.append({
-                "type": "add_min_height",
-                "target": "body",
-                "value": "100vh",
-                "reason": "Ensure page is scrollable",
-                "priority": 2
-            })
-            
-        elif issue_type == "overflow":
-            if "horizontal" in description.lower():
-                fix_actions.append({
-                    "type": "fix_horizontal_overflow",
-                    "target": "body",
-                    "reason": "Prevent horizontal scrolling",
-                    "priority": 1
-                })
-                
-        elif issue_type == "responsive":
-            fix_actions.append({
-                "type": "add_viewport_meta",
-                "reason": "Enable responsive behavior",
-                "priority": 1
-            })
-            fix_actions.append({
-                "type": "add_responsive_css",
-                "reason": "Ensure mobile compatibility",
-                "priority": 2
-            })
-            
-        elif issue_type == "accessibility":
-            if "title" in description.lower():
-                fix_actions.append({
-                    "type": "add_title",
-                    "value": "Generated Website",
-                    "reason": "Add missing page title",
-                    "priority": 2
-                })
-            if "alt" in description.lower():
-                fix_actions.append({
-                    "type": "add_alt_text",
-                    "reason": "Add alt text to images",
-                    "priority": 3
-                })
-                
-        elif issue_type == "structure":
-            if "few sections" in description.lower():
-                fix_actions.append({
-                    "type": "verify_structure",
-                    "reason": "Check page structure",
-                    "priority": 3
-                })
+        # Create fix actions based on issue type
+        handler = _ISSUE_HANDLERS.get(issue.get("type", ""))
+        if handler is not None:
+            fix_actions.extend(handler(issue.get("description", "").lower()))
     
     # Sort by priority (lower number = higher priority)
     fix_actions.sort(key=lambda x: x.get("priority", 999))
@@ -114,19 +154,140 @@ def apply_fixes(html_content: str, fix_actions: List[dict]) -> Tuple[str, List[s
     Returns:
         Tuple of (modified HTML content, list of applied fixes)
     """
-    soup = BeautifulSoup(html_content, 'html.parser')
+    fast = _fast_path_fixes(html_content, fix_actions)
+    if fast is not None:
+        return fast
+    
+    soup = BeautifulSoup(html_content, HTML_PARSER)
+    applied_fixes = apply_fixes_to_soup(soup, fix_actions)
+    
+    if not applied_fixes:
+        # Nothing changed (or was attempted); skip serializing the tree
+        return html_content, applied_fixes
+    
+    return str(soup), applied_fixes
+
+
+# Fixes that _fast_path_fixes can apply to the raw text
+_FAST_PATH_ACTIONS = frozenset({"add_viewport_meta", "add_title", "add_min_height"})
+
+# <head> open/close tags (not <header>) and the tags the fast path checks for
+_HEAD_OPEN = re.compile(r"<head(?:\s[^>]*)?>", re.I)
+_HEAD_CLOSE = re.compile(r"</head\s*>", re.I)
+_VIEWPORT_META = re.compile(r"<meta\b[^>]*\bname\s*=\s*[\"']?viewport\b", re.I)
+_TITLE_OPEN = re.compile(r"<title\b", re.I)
+_STYLE_OPEN = re.compile(r"<style\b", re.I)
+
+
+def _fast_path_fixes(html_content: str, fix_actions: List[dict]) -> Optional[Tuple[str, List[str]]]:
+    """
+    Apply <head>-only fixes with string edits, skipping the parse/serialize round trip.
+    
+    Args:
+        html_content: Original HTML content
+        fix_actions: List of fixes to apply
+        
+    Returns:
+        Tuple of (modified HTML content, list of applied fixes), or None if
+        any action needs the parsed document
+    """
+    if not all(action.get("type") in _FAST_PATH_ACTIONS for action in fix_actions):
+        return None
+    
+    head_open = _HEAD_OPEN.search(html_content)
+    head_close = _HEAD_CLOSE.search(html_content)
+    if head_open is None or head_close is None or head_close.start() < head_open.end():
+        return None
+    
+    # Existing titles (possibly empty) and style tags need the DOM to update
+    types = {action["type"] for action in fix_actions}
+    if "add_title" in types and _TITLE_OPEN.search(html_content):
+        return None
+    if "add_min_height" in types and _STYLE_OPEN.search(html_content):
+        return None
+    
+    # Tags inserted at the top of <head> (newest first, as head.insert(0) does)
+    # and the rules for a new <style> at its end
+    prepend = []
+    style_rules = []
+    inserted = set()
     applied_fixes = []
     
+    for action in fix_actions:
+        action_type = action["type"]
+        
+        if action_type == "add_viewport_meta":
+            if action_type in inserted or _VIEWPORT_META.search(html_content):
+                continue
+            prepend.insert(0, '<meta content="width=device-width, initial-scale=1.0" name="viewport"/>')
+            applied_fixes.append("Added viewport meta tag")
+            
+        elif action_type == "add_title":
+            if action_type in inserted:
+                continue
+            prepend.insert(0, f"<title>{html.escape(action.get('value', 'Website'), quote=False)}</title>")
+            applied_fixes.append("Added page title")
+            
+        elif action_type == "add_min_height":
+            target = action.get("target", "body")
+            new_rule = f"\n{target} {{ min-height: {action.get('value', '100vh')}; }}"
+            if new_rule in style_rules:
+                continue
+            style_rules.append(new_rule)
+            applied_fixes.append(f"Added min-height to {target}")
+        
+        inserted.add(action_type)
+    
+    if not applied_fixes:
+        return html_content, applied_fixes
+    
+    style = f"<style>{''.join(style_rules)}</style>" if style_rules else ""
+    fixed_html = "".join([
+        html_content[:head_open.end()],
+        "".join(prepend),
+        html_content[head_open.end():head_close.start()],
+        style,
+        html_content[head_close.start():]
+    ])
+    
+    return fixed_html, applied_fixes
+
+
+def apply_fixes_to_soup(soup: BeautifulSoup, fix_actions: List[dict]) -> List[str]:
+    """
+    Apply fix actions to an already parsed document, in place.
+    
+    Lets callers that fix the same document repeatedly keep one tree
+    instead of re-parsing the serialized HTML every time.
+    
+    Args:
+        soup: Parsed HTML document (modified in place)
+        fix_actions: List of fixes to apply
+        
+    Returns:
+        List of applied fixes
+    """
+    applied_fixes = []
+    
+    # The CSS fixes share one <style> tag, looked up (or created) on first use
+    style_tag = None
+    
+    def _style_tag():
+        nonlocal style_tag
+        if style_tag is None:
+            style_tag = _find_or_create_style_tag(soup)
+        return style_tag
+    
     for action in fix_actions:
         action_type = action.get("type", "")
         
         try:
             if action_type == "add_min_height":
-                if apply_min_height_fix(soup, action):
+                if apply_min_height_fix(soup, action, _style_tag()):
                     applied_fixes.append(f"Added min-height to {action['target']}")
                     
             elif action_type == "fix_horizontal_overflow":
-                if apply_overflow_fix(soup):
+                if apply_overflow_fix(soup, _style_tag()):
                     applied_fixes.append("Fixed horizontal overflow")
                     
             elif action_type == "add_viewport_meta":
@@ -134,7 +295,7 @@ def apply_fixes(html_content: str, fix_actions: List[dict]) -> Tuple[str, List[s
                     applied_fixes.append("Added viewport meta tag")
                     
             elif action_type == "add_responsive_css":
-                if apply_responsive_css_fix(soup):
+                if apply_responsive_css_fix(soup, _style_tag()):
                     applied_fixes.append("Added responsive CSS")
                     
             elif action_type == "add_title":
@@ -150,65 +311,85 @@ def apply_fixes(html_content: str, fix_actions: List[dict]) -> Tuple[str, List[s
             # Log error but continue with other fixes
             applied_fixes.append(f"Failed to apply {action_type}: {str(e)}")
     
-    return str(soup), applied_fixes
+    return applied_fixes
+
+
+# CSS added by apply_overflow_fix
+_OVERFLOW_CSS = """
+body {
+    overflow-x: hidden;
+}
+* {
+    max-width: 100%;
+    box-sizing: border-box;
+}
+img, video, iframe {
+    max-width: 100%;
+    height: auto;
+}
+"""
+
+# CSS added by apply_responsive_css_fix
+_RESPONSIVE_CSS = """
+@media (max-width: 768px) {
+    body {
+        padding: 10px;
+    }
+    section {
+        padding: 30px 15px !important;
+    }
+    h1 {
+        font-size: 1.8rem !important;
+    }
+    h2 {
+        font-size: 1.5rem !important;
+    }
+}
+"""
+
+
+def _find_or_create_style_tag(soup: BeautifulSoup):
+    """Return the document's first <style> tag, adding one to <head> if needed (None if no head)"""
+    style_tag = soup.find("style")
+    if not style_tag:
+        head = soup.find("head")
+        if not head:
+            return None
+        style_tag = soup.new_tag("style")
+        head.append(style_tag)
+    return style_tag
 
 
-def apply_min_height_fix(soup: BeautifulSoup, action: dict) -> bool:
+def apply_min_height_fix(soup: BeautifulSoup, action: dict, style_tag=None) -> bool:
     """Add min-height to target element"""
     target = action.get("target", "body")
     value = action.get("value", "100vh")
     
-    # Find or create style tag
-    style_tag = soup.find("style")
-    if not style_tag:
-        style_tag = soup.new_tag("style")
-        head = soup.find("head")
-        if head:
-            head.append(style_tag)
-        else:
+    if style_tag is None:
+        style_tag = _find_or_create_style_tag(soup)
+        if style_tag is None:
             return False
     
     # Add min-height rule
-    current_style = style_tag.string or ""
     new_rule = f"\n{target} {{ min-height: {value}; }}"
     
-    if new_rule not in current_style:
-        style_tag.string = current_style + new_rule
+    if new_rule not in style_tag.get_text():
+        style_tag.append(Stylesheet(new_rule))
         return True
     
     return False
 
 
-def apply_overflow_fix(soup: BeautifulSoup) -> bool:
+def apply_overflow_fix(soup: BeautifulSoup, style_tag=None) -> bool:
     """Fix horizontal overflow issues"""
-    # Find or create style tag
-    style_tag = soup.find("style")
-    if not style_tag:
-        style_tag = soup.new_tag("style")
-        head = soup.find("head")
-        if head:
-            head.append(style_tag)
-        else:
+    if style_tag is None:
+        style_tag = _find_or_create_style_tag(soup)
+        if style_tag is None:
             return False
     
     # Add overflow prevention CSS
-    overflow_css = """
-body {
-    overflow-x: hidden;
-}
-* {
-    max-width: 100%;
-    box-sizing: border-box;
-}
-img, video, iframe {
-    max-width: 100%;
-    height: auto;
-}
-"""
-    
-    current_style = style_tag.string or ""
-    if "overflow-x: hidden" not in current_style:
-        style_tag.string = current_style + overflow_css
+    if "overflow-x: hidden" not in style_tag.get_text():
+        style_tag.append(Stylesheet(_OVERFLOW_CSS))
         return True
     
     return False
@@ -237,39 +418,16 @@ def apply_viewport_meta_fix(soup: BeautifulSoup) -> bool:
     return True
 
 
-def apply_responsive_css_fix(soup: BeautifulSoup) -> bool:
+def apply_responsive_css_fix(soup: BeautifulSoup, style_tag=None) -> bool:
     """Add responsive CSS rules"""
-    # Find or create style tag
-    style_tag = soup.find("style")
-    if not style_tag:
-        style_tag = soup.new_tag("style")
-        head = soup.find("head")
-        if head:
-            head.append(style_tag)
-        else:
+    if style_tag is None:
+        style_tag = _find_or_create_style_tag(soup)
+        if style_tag is None:
             return False
     
     # Add responsive CSS
-    responsive_css = """
-@media (max-width: 768px) {
-    body {
-        padding: 10px;
-    }
-    section {
-        padding: 30px 15px !important;
-    }
-    h1 {
-        font-size: 1.8rem !important;
-    }
-    h2 {
-        font-size: 1.5rem !important;
-    }
-}
-"""
-    
-    current_style = style_tag.string or ""
-    if "@media" not in current_style:
-        style_tag.string = current_style + responsive_css
+    if "@media" not in style_tag.get_text():
+        style_tag.append(Stylesheet(_RESPONSIVE_CSS))
         return True
     
     return False
@@ -302,28 +460,81 @@ def apply_title_fix(soup: BeautifulSoup, title: str) -> bool:
         return True
 
 
+# Turns file name separators into spaces for generated alt text
+_ALT_TEXT_TABLE = str.maketrans({"-": " ", "_": " "})
+
+
 def apply_alt_text_fix(soup: BeautifulSoup) -> int:
     """Add alt text to images that don't have it"""
     count = 0
-    images = soup.find_all("img")
-    
-    for img in images:
-        if not img.get("alt"):
-            # Generate alt text based on src or use generic
-            src = img.get("src", "")
-            if src:
-                # Extract filename without extension
-                alt_text = Path(src).stem.replace("-", " ").replace("_", " ").title()
-            else:
-                alt_text = "Image"
-            
-            img["alt"] = alt_text
-            count += 1
+    
+    # Only images with a missing or empty alt attribute
+    for img in soup.select('img:not([alt]), img[alt=""]'):
+        # Generate alt text based on src or use generic
+        src = img.get("src", "")
+        if src:
+            # Extract filename without extension
+            alt_text = Path(src).stem.translate(_ALT_TEXT_TABLE).title()
+        else:
+            alt_text = "Image"
+        
+        img["alt"] = alt_text
+        count += 1
     
     return count
 
 
-def auto_fix_website(html_content: str, validation_report: dict = None, max_attempts: int = 3) -> Tuple[str, dict]:
+# Severities that keep the fix loop going
+_CRITICAL_SEVERITIES = frozenset({"critical", "high"})
+
+
+def _no_critical_issues(validation_report: dict) -> bool:
+    """Whether a validation report has no critical or high severity issues."""
+    return not any(
+        i.get("severity") in _CRITICAL_SEVERITIES
+        for i in validation_report.get("issues", ())
+    )
+
+
+class FixReport(UserDict):
+    """
+    Fix report returned by auto_fix_website and fix_from_file.
+    
+    When the last fix attempt changed the page, no later attempt acts on a
+    new validation, so "final_issues" and "success" are filled in by a
+    validation pass that runs the first time either is read. Callers that
+    never look at them skip that browser render.
+    """
+    
+    _DEFERRED_KEYS = frozenset({"final_issues", "success"})
+    
+    def __init__(self, *args, **kwargs):
+        self._final_validation = None
+        super().__init__(*args, **kwargs)
+    
+    def defer_final_validation(self, validate: Callable[[], dict]):
+        """Compute final_issues and success from validate() when first read."""
+        self._final_validation = validate
+    
+    def _run_final_validation(self):
+        validate, self._final_validation = self._final_validation, None
+        validation_report = validate()
+        self.data["final_issues"] = len(validation_report.get("issues", []))
+        self.data["success"] = _no_critical_issues(validation_report)
+    
+    def __getitem__(self, key):
+        if self._final_validation is not None and key in self._DEFERRED_KEYS:
+            self._run_final_validation()
+        return super().__getitem__(key)
+    
+    def __repr__(self):
+        if self._final_validation is not None:
+            self._run_final_validation()
+        return super().__repr__()
+
+
+def auto_fix_website(html_content: str, validation_report: dict = None, max_attempts: int = 3,
+                     playwright_ctx=None) -> Tuple[str, FixReport]:
     """
     Automatically fix website based on validation issues.
     
@@ -331,25 +542,60 @@ def auto_fix_website(html_content: str, validation_report: dict = None, max_atte
         html_content: HTML content to fix
         validation_report: Validation report with issues (optional - will validate if not provided)
         max_attempts: Maximum fix iterations
+        playwright_ctx: Optional Playwright BrowserContext for re-validation
+        
+    Returns:
+        Tuple of (fixed HTML content, fix report); see FixReport
+    """
+    from src.visual_validator import validate_html_string
+    
+    # Get initial validation if not provided
+    if validation_report is None:
+        validation_report = validate_html_string(
+            html_content, f"fix_attempt_0.html", playwright_ctx=playwright_ctx
+        )
+    
+    fixed_html, fix_report = _fix_until_valid(
+        lambda: BeautifulSoup(html_content, HTML_PARSER),
+        validation_report, max_attempts, playwright_ctx, html_content
+    )
+    
+    return (html_content if fixed_html is None else fixed_html), fix_report
+
+
+def _fix_until_valid(parse, validation_report: dict, max_attempts: int,
+                     playwright_ctx=None, html_content: Optional[str] = None) -> Tuple[Optional[str], FixReport]:
+    """
+    Apply fixes and re-validate until no critical/high issues remain.
+    
+    Args:
+        parse: Callable returning the parsed document; only called if there
+               is something to fix
+        validation_report: Validation report for the original document
+        max_attempts: Maximum fix iterations
+        playwright_ctx: Optional Playwright BrowserContext for re-validation
+        html_content: The original document as text, if the caller has it;
+                      enables the string-only fast path for simple fixes
         
     Returns:
-        Tuple of (fixed HTML content, fix report)
+        Tuple of (fixed HTML content or None if nothing was changed, fix report)
     """
     from src.visual_validator import validate_html_string
     
-    fix_report = {
+    fix_report = FixReport({
         "attempts": 0,
         "fixes_applied": [],
         "initial_issues": 0,
         "final_issues": 0,
-        "success": False
-    }
+        "success": False,
+        "no_progress": False
+    })
     
-    current_html = html_content
+    current_html = None
+    previous_actions_key = None
     
-    # Get initial validation if not provided
-    if validation_report is None:
-        validation_report = validate_html_string(current_html, f"fix_attempt_0.html")
+    # Parsed once; fixes are applied to this tree on every iteration
+    soup = None
     
     fix_report["initial_issues"] = len(validation_report.get("issues", []))
     
@@ -364,20 +610,55 @@ def auto_fix_website(html_content: str, validation_report: dict = None, max_atte
             # No more fixes to apply
             break
         
-        # Apply fixes
-        current_html, applied = apply_fixes(current_html, fix_actions)
+        # Fixes are idempotent, so the same set as last time can't change anything
+        actions_key = tuple(
+            (action.get("type"), action.get("target"), action.get("value"))
+            for action in fix_actions
+        )
+        if actions_key == previous_actions_key:
+            fix_report["no_progress"] = True
+            break
+        previous_actions_key = actions_key
+        
+        # Apply fixes, on the raw text while only simple <head> edits are needed
+        fast = None
+        if soup is None:
+            source = html_content if current_html is None else current_html
+            if source is not None:
+                fast = _fast_path_fixes(source, fix_actions)
+        
+        if fast is not None:
+            fixed_html, applied = fast
+        else:
+            if soup is None:
+                soup = parse() if current_html is None else BeautifulSoup(current_html, HTML_PARSER)
+            applied = apply_fixes_to_soup(soup, fix_actions)
+            fixed_html = None
+        
+        if not applied:
+            # Every fix was already in place, so the document is unchanged and
+            # re-validating would return the same report and the same fixes
+            fix_report["no_progress"] = True
+            break
+        
+        current_html = str(soup) if fixed_html is None else fixed_html
         fix_report["fixes_applied"].extend(applied)
         
+        if attempt == max_attempts - 1:
+            # No further attempt would act on a new report; validate only
+            # if the caller reads final_issues or success
+            fix_report.defer_final_validation(lambda html=current_html: validate_html_string(
+                html, f"fix_attempt_{max_attempts}.html", playwright_ctx=playwright_ctx
+            ))
+            return current_html, fix_report
+        
         # Re-validate
-        validation_report = validate_html_string(current_html, f"fix_attempt_{attempt + 1}.html")
+        validation_report = validate_html_string(
+            current_html, f"fix_attempt_{attempt + 1}.html", playwright_ctx=playwright_ctx
+        )
         
         # Check if we've fixed critical/high issues
-        critical_high_issues = [
-            i for i in validation_report.get("issues", [])
-            if i.get("severity") in ["critical", "high"]
-        ]
-        
-        if len(critical_high_issues) == 0:
+        if _no_critical_issues(validation_report):
             fix_report["success"] = True
             break
     
@@ -386,7 +667,7 @@ def auto_fix_website(html_content: str, validation_report: dict = None, max_atte
     return current_html, fix_report
 
 
-def fix_from_file(html_path: str, output_path: str = None, max_attempts: int = 3) -> dict:
+def fix_from_file(html_path: str, output_path: str = None, max_attempts: int = 3) -> FixReport:
     """
     Fix HTML file and save the result.
     
@@ -398,12 +679,17 @@ def fix_from_file(html_path: str, output_path: str = None, max_attempts: int = 3
     Returns:
         Fix report dictionary
     """
-    # Read original HTML
-    with open(html_path, 'r', encoding='utf-8') as f:
-        html_content = f.read()
+    from src.visual_validator import validate_layout
     
-    # Apply fixes
-    fixed_html, fix_report = auto_fix_website(html_content, max_attempts=max_attempts)
+    def parse():
+        # Opened only once there is something to fix; decoded as UTF-8, like
+        # the output, rather than left to bs4's charset guessing
+        with open(html_path, 'rb') as f:
+            return BeautifulSoup(f, HTML_PARSER, from_encoding="utf-8")
+    
+    # The file is validated where it is, without writing a temp copy
+    validation_report = validate_layout(html_path)
+    fixed_html, fix_report = _fix_until_valid(parse, validation_report, max_attempts)
     
     # Determine output path
     if output_path is None:
@@ -411,8 +697,15 @@ def fix_from_file(html_path: str, output_path: str = None, max_attempts: int = 3
         output_path = path.parent / f"{path.stem}_fixed{path.suffix}"
     
     # Save fixed HTML
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(fixed_html)
+    if fixed_html is None:
+        # Nothing was changed; copy the original bytes
+        try:
+            shutil.copyfile(html_path, output_path)
+        except shutil.SameFileError:
+            pass
+    else:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(fixed_html)
     
     fix_report["output_path"] = str(output_path)
     
@@ -440,6 +733,8 @@ def generate_fix_summary(fix_report: dict) -> str:
     
     # Attempts
     summary.append(f"Fix Attempts: {fix_report['attempts']}")
+    if fix_report.get("no_progress"):
+        summary.append("Stopped early: remaining issues can't be fixed automatically")
     
     # Issues
     initial = fix_report["initial_issues"]
@@ -0,0 +1,89 @@
+"""
+Gemini Client Module
+Shared access to Gemini model instances.
+
+Responsibilities:
+- Configure the SDK once, on a transport that keeps its connection open
+- Construct GenerativeModel objects once per model name
+- Let every caller (intent parser, component generator, debug scripts)
+  reuse the same model and its underlying connection
+
+Callers are still responsible for calling configure() with an API key
+before generating content.
+
+The SDK is imported on first use, so modules that only check whether AI
+is available never pay its import cost.
+"""
+
+import functools
+import importlib.util
+import os
+
+# gRPC keeps one HTTP/2 channel per client open, so the TCP and TLS
+# handshakes are paid once rather than on every request
+GEMINI_TRANSPORT = os.getenv("GEMINI_TRANSPORT", "grpc")
+
+# Value of GEMINI_API_KEY in the .env template, i.e. no real key
+PLACEHOLDER_API_KEY = "your_gemini_api_key_here"
+
+# API key the SDK was last configured with
+_CONFIGURED_KEY = None
+
+
+def api_key_configured(api_key) -> bool:
+    """
+    Check whether a real Gemini API key is set, without touching the SDK.
+    
+    Args:
+        api_key: Value of GEMINI_API_KEY (may be None)
+        
+    Returns:
+        True if the key is non-empty and not the .env placeholder
+    """
+    return bool(api_key) and api_key != PLACEHOLDER_API_KEY
+
+
+@functools.lru_cache(maxsize=1)
+def sdk_installed() -> bool:
+    """
+    Check whether google-generativeai is installed, without importing it.
+    
+    Returns:
+        True if the SDK can be imported
+    """
+    try:
+        return importlib.util.find_spec("google.generativeai") is not None
+    except ModuleNotFoundError:
+        return False
+
+
+def configure(api_key: str):
+    """
+    Configure the Gemini SDK, once per API key.
+    
+    Re-running genai.configure() drops the SDK's clients and their open
+    connections, so repeated calls with the same key are skipped.
+    
+    Args:
+        api_key: Gemini API key
+    """
+    global _CONFIGURED_KEY
+    if api_key != _CONFIGURED_KEY:
+        import google.generativeai as genai
+        genai.configure(api_key=api_key, transport=GEMINI_TRANSPORT)
+        _CONFIGURED_KEY = api_key
+
+
+@functools.lru_cache(maxsize=4)
+def get_model(model_name: str):
+    """
+    Get a shared Gemini model instance.
+
+    Args:
+        model_name: Gemini model name (e.g. "gemini-2.0-flash")
+
+    Returns:
+        Cached GenerativeModel for that name
+    """
+    import google.generativeai as genai
+    return genai.GenerativeModel(model_name)
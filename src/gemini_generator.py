@@ -14,12 +14,19 @@ Features:
 
 import os
 import json
+import asyncio
+import functools
 import hashlib
+import queue
+import re
+import sqlite3
+import threading
 import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple
 from dotenv import load_dotenv
-import google.generativeai as genai
+from src.gemini_client import api_key_configured, configure, get_model, sdk_installed
 
 # Load environment variables
 load_dotenv()
@@ -33,16 +40,112 @@ CACHE_ENABLED = os.getenv("CACHE_AI_COMPONENTS", "true").lower() == "true"
 CACHE_DIR = Path(os.getenv("CACHE_DIRECTORY", ".cache/ai_components"))
 
 # Rate limiting configuration
-RATE_LIMIT_DELAY = float(os.getenv("RATE_LIMIT_DELAY", "2.0"))  # Seconds between requests
+REQUESTS_PER_MINUTE = float(os.getenv("REQUESTS_PER_MINUTE", "30"))  # Gemini requests allowed per minute
 MAX_RETRIES = int(os.getenv("MAX_RETRIES", "3"))
 RETRY_DELAY = float(os.getenv("RETRY_DELAY", "5.0"))  # Initial retry delay
+MAX_CONCURRENT_REQUESTS = int(os.getenv("MAX_CONCURRENT_REQUESTS", "5"))  # Parallel section generations
+AI_BATCH_SIZE = int(os.getenv("AI_BATCH_SIZE", "4"))  # Max sections per Gemini request (1 = one request per section)
+AI_SECTION_TOKENS = int(os.getenv("AI_SECTION_TOKENS", "3000"))  # Output tokens budgeted per section in a batch
 
-# Initialize Gemini
-if GEMINI_API_KEY and GEMINI_API_KEY != "your_gemini_api_key_here":
-    genai.configure(api_key=GEMINI_API_KEY)
-    MODEL = genai.GenerativeModel(GEMINI_MODEL)
-else:
-    MODEL = None
+# Sections actually sent per batched request: a batch's combined JSON must fit
+# in AI_MAX_TOKENS, since a cut-off response is discarded and regenerated
+# one request per section
+_BATCH_SIZE = max(1, min(AI_BATCH_SIZE, AI_MAX_TOKENS // AI_SECTION_TOKENS))
+
+# Whether an API key is set; the SDK itself is only imported by _get_model()
+AI_CONFIGURED = api_key_configured(GEMINI_API_KEY)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_model():
+    """
+    Configure Gemini and return the shared model, importing the SDK on first use.
+    
+    Returns:
+        GenerativeModel, or None if AI is not available
+    """
+    if not is_ai_available():
+        return None
+    
+    configure(GEMINI_API_KEY)
+    return get_model(GEMINI_MODEL)
+
+
+@functools.lru_cache(maxsize=1)
+def _rate_limit_errors() -> tuple:
+    """Errors Gemini raises when a request is throttled (HTTP 429)."""
+    from google.api_core import exceptions as google_exceptions
+    return (google_exceptions.ResourceExhausted, google_exceptions.TooManyRequests)
+
+
+class TokenBucket:
+    """
+    Token bucket rate limiter.
+    
+    Holds up to `capacity` tokens and regains `refill_rate` tokens per second,
+    so requests go out immediately while under quota and only wait once
+    the bucket is empty. Only used from the shared Gemini event loop.
+    """
+    
+    def __init__(self, capacity: float, refill_rate: float):
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+    
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate)
+        self.last_refill = now
+    
+    async def acquire(self, n: float = 1):
+        """Wait until n tokens are available, then take them."""
+        while True:
+            self._refill()
+            if self.tokens >= n:
+                self.tokens -= n
+                return
+            await asyncio.sleep((n - self.tokens) / self.refill_rate)
+
+
+# Paces requests to the model's per-minute quota
+_RPM_BUCKET = TokenBucket(capacity=REQUESTS_PER_MINUTE, refill_rate=REQUESTS_PER_MINUTE / 60)
+
+
+def _retry_delay(error: Exception, attempt: int) -> float:
+    """Seconds to wait after a rate-limit error: the server's hint if given, else exponential backoff."""
+    for detail in getattr(error, "details", None) or ():
+        delay = getattr(detail, "retry_delay", None)
+        if delay is not None:
+            return delay.seconds + delay.nanos / 1e9
+    return RETRY_DELAY * (2 ** attempt)
+
+
+# Event loop for the async Gemini client, running on a daemon thread for the
+# life of the process. The client's channels are bound to the loop that
+# created them, so every call has to go through this one loop.
+_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_LOOP_LOCK = threading.Lock()
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared Gemini event loop, starting it on first use."""
+    global _LOOP
+    with _LOOP_LOCK:
+        if _LOOP is None:
+            _LOOP = asyncio.new_event_loop()
+            threading.Thread(target=_LOOP.run_forever, name="gemini-loop", daemon=True).start()
+    return _LOOP
+
+
+def _run(coro):
+    """Run a coroutine on the shared Gemini event loop and wait for its result."""
+    return asyncio.run_coroutine_threadsafe(coro, _get_loop()).result()
+
+
+# Component generations in progress (cache key -> task). Only used from the
+# shared Gemini loop, so no lock is needed.
+_INFLIGHT: Dict[str, asyncio.Task] = {}
 
 
 def generate_component_with_ai(
@@ -65,67 +168,348 @@ def generate_component_with_ai(
     Returns:
         Tuple of (HTML component code, metadata)
     """
-    if not MODEL:
+    return _run(generate_component_with_ai_async(
+        section_type, user_prompt, framework, style, additional_context
+    ))
+
+
+async def generate_component_with_ai_async(
+    section_type: str,
+    user_prompt: str,
+    framework: str = "bootstrap",
+    style: str = "modern",
+    additional_context: Optional[Dict] = None
+) -> Tuple[str, Dict]:
+    """
+    Async version of generate_component_with_ai.
+    
+    Awaits the Gemini request and any waits instead of blocking a thread,
+    so many sections can be in flight on one event loop. Identical requests
+    made while one is in flight share its Gemini call.
+    
+    Returns:
+        Tuple of (HTML component code, metadata)
+    """
+    model = _get_model()
+    if not model:
         raise ValueError("Gemini API key not configured. Please set GEMINI_API_KEY in .env file")
     
     # Check cache first
     if CACHE_ENABLED:
-        cached_component = _get_cached_component(section_type, user_prompt, framework, style)
+        cached_component = await _get_cached_component_async(section_type, user_prompt, framework, style)
         if cached_component:
             return cached_component, {"cached": True, "section_type": section_type}
     
-    # Build comprehensive prompt for Gemini
+    cache_key = _get_cache_key(section_type, user_prompt, framework, style)
+    task = _INFLIGHT.get(cache_key)
+    if task is None:
+        task = asyncio.ensure_future(_generate_component_uncached(
+            model, section_type, user_prompt, framework, style, additional_context
+        ))
+        _INFLIGHT[cache_key] = task
+        task.add_done_callback(lambda _: _INFLIGHT.pop(cache_key, None))
+    
+    # Shielded, so one caller being cancelled doesn't cancel it for the others
+    html_component, metadata = await asyncio.shield(task)
+    return html_component, dict(metadata)
+
+
+async def _generate_component_uncached(
+    model,
+    section_type: str,
+    user_prompt: str,
+    framework: str,
+    style: str,
+    additional_context: Optional[Dict]
+) -> Tuple[str, Dict]:
+    """
+    Generate a component with Gemini and cache it.
+    
+    Returns:
+        Tuple of (HTML component code, metadata)
+    """
+    # Stream the component, extracting HTML as it arrives
+    html_component = "".join([
+        piece async for piece in _stream_component_async(
+            model, section_type, user_prompt, framework, style, additional_context
+        )
+    ])
+    
+    # Cache the generated component
+    if CACHE_ENABLED and html_component:
+        await _cache_component_async(section_type, user_prompt, framework, style, html_component)
+    
+    metadata = {
+        "section_type": section_type,
+        "framework": framework,
+        "style": style,
+        "ai_generated": True,
+        "cached": False
+    }
+    
+    return html_component, metadata
+
+
+def generate_component_stream(
+    section_type: str,
+    user_prompt: str,
+    framework: str = "bootstrap",
+    style: str = "modern",
+    additional_context: Optional[Dict] = None
+) -> Iterator[str]:
+    """
+    Generate a website component using Gemini AI, yielding HTML as it streams in.
+    
+    Args:
+        section_type: Type of section (navbar, hero, features, etc.)
+        user_prompt: Original user prompt with content details
+        framework: UI framework to use (bootstrap, tailwind, etc.)
+        style: Design style (modern, minimal, corporate, etc.)
+        additional_context: Additional context like colors, brand name, etc.
+        
+    Yields:
+        Pieces of the component HTML; joined they equal generate_component_with_ai()'s HTML
+    """
+    pieces = queue.Queue()
+    done = object()
+    
+    async def produce():
+        try:
+            async for piece in generate_component_stream_async(
+                section_type, user_prompt, framework, style, additional_context
+            ):
+                pieces.put(piece)
+        except Exception as e:
+            pieces.put(e)
+        finally:
+            pieces.put(done)
+    
+    # Generation runs on the shared Gemini loop; pieces are handed over through the queue
+    future = asyncio.run_coroutine_threadsafe(produce(), _get_loop())
+    try:
+        while (piece := pieces.get()) is not done:
+            if isinstance(piece, Exception):
+                raise piece
+            yield piece
+    finally:
+        future.cancel()
+
+
+async def generate_component_stream_async(
+    section_type: str,
+    user_prompt: str,
+    framework: str = "bootstrap",
+    style: str = "modern",
+    additional_context: Optional[Dict] = None
+) -> AsyncIterator[str]:
+    """
+    Async version of generate_component_stream.
+    
+    A cached component is yielded whole. A newly generated one is cached
+    once the stream has been read to the end.
+    
+    Yields:
+        Pieces of the component HTML
+    """
+    model = _get_model()
+    if not model:
+        raise ValueError("Gemini API key not configured. Please set GEMINI_API_KEY in .env file")
+    
+    if CACHE_ENABLED:
+        cached_component = await _get_cached_component_async(section_type, user_prompt, framework, style)
+        if cached_component:
+            yield cached_component
+            return
+    
+    parts = []
+    async for piece in _stream_component_async(
+        model, section_type, user_prompt, framework, style, additional_context
+    ):
+        parts.append(piece)
+        yield piece
+    
+    html_component = "".join(parts)
+    if CACHE_ENABLED and html_component:
+        await _cache_component_async(section_type, user_prompt, framework, style, html_component)
+
+
+async def _stream_component_async(
+    model,
+    section_type: str,
+    user_prompt: str,
+    framework: str,
+    style: str,
+    additional_context: Optional[Dict]
+) -> AsyncIterator[str]:
+    """
+    Request a component as a stream and yield its HTML as it is extracted.
+    """
     ai_prompt = _build_component_prompt(section_type, user_prompt, framework, style, additional_context)
     
+    response = await _generate_content_async(model, ai_prompt, {
+        "temperature": AI_TEMPERATURE,
+        "max_output_tokens": AI_MAX_TOKENS,
+        "response_mime_type": "application/json",
+        "response_schema": _COMPONENT_SCHEMA,
+    }, stream=True)
+    
+    extractor = _StreamingHTMLExtractor()
+    try:
+        async for chunk in response:
+            html = extractor.feed(chunk.text)
+            if html:
+                yield html
+    except Exception as e:
+        raise Exception(f"AI component generation failed: {e}")
+    
+    html = extractor.close()
+    if html:
+        yield html
+
+
+async def _generate_content_async(model, ai_prompt: str, generation_config: Dict, stream: bool = False):
+    """
+    Send one request to Gemini, pacing it and retrying on rate limits.
+    
+    Args:
+        model: GenerativeModel to call
+        ai_prompt: Prompt text
+        generation_config: Gemini generation config
+        stream: Return the streaming response instead of the response text
+        
+    Returns:
+        Response text, or the async streaming response if stream is set
+    """
     # Retry logic with exponential backoff
     for attempt in range(MAX_RETRIES):
+        await _RPM_BUCKET.acquire()
+        
         try:
-            # Generate component with Gemini
-            response = MODEL.generate_content(
-                ai_prompt,
-                generation_config=genai.GenerationConfig(
-                    temperature=AI_TEMPERATURE,
-                    max_output_tokens=AI_MAX_TOKENS,
-                )
+            response = await model.generate_content_async(
+                ai_prompt, generation_config=generation_config, stream=stream
             )
+            return response if stream else response.text
             
-            # Extract HTML from response
-            html_component = _extract_html_from_response(response.text)
-            
-            # Cache the generated component
-            if CACHE_ENABLED and html_component:
-                _cache_component(section_type, user_prompt, framework, style, html_component)
-            
-            metadata = {
-                "section_type": section_type,
-                "framework": framework,
-                "style": style,
-                "ai_generated": True,
-                "cached": False
-            }
+        except _rate_limit_errors() as e:
+            if attempt < MAX_RETRIES - 1:
+                # Back off without blocking the other sections' requests
+                await asyncio.sleep(_retry_delay(e, attempt))
+                continue
             
-            # Add delay before next request to avoid rate limits
-            time.sleep(RATE_LIMIT_DELAY)
-            
-            return html_component, metadata
+            raise Exception(f"AI component generation failed: {e}")
             
         except Exception as e:
-            error_msg = str(e)
-            
-            # Check if it's a rate limit error (429)
-            if "429" in error_msg or "Resource exhausted" in error_msg or "quota" in error_msg.lower():
-                if attempt < MAX_RETRIES - 1:
-                    # Exponential backoff: wait longer each retry
-                    wait_time = RETRY_DELAY * (2 ** attempt)
-                    time.sleep(wait_time)
-                    continue
-            
-            # For non-rate-limit errors or final retry, raise
-            raise Exception(f"AI component generation failed: {error_msg}")
+            # For non-rate-limit errors, raise
+            raise Exception(f"AI component generation failed: {e}")
     
     raise Exception(f"AI component generation failed after {MAX_RETRIES} retries")
 
 
+def generate_website_batched(
+    sections: List[str],
+    user_prompt: str,
+    framework: str = "bootstrap",
+    style: str = "modern",
+    additional_context: Optional[Dict] = None
+) -> Dict[str, str]:
+    """
+    Generate several sections with a single Gemini request.
+    
+    Args:
+        sections: Section types to generate
+        user_prompt: Original user prompt with content details
+        framework: UI framework to use (bootstrap, tailwind, etc.)
+        style: Design style (modern, minimal, corporate, etc.)
+        additional_context: Additional context like colors, brand name, etc.
+        
+    Returns:
+        Dictionary mapping section types to HTML; sections Gemini left out are missing
+    """
+    return _run(generate_website_batched_async(
+        sections, user_prompt, framework, style, additional_context
+    ))
+
+
+async def generate_website_batched_async(
+    sections: List[str],
+    user_prompt: str,
+    framework: str = "bootstrap",
+    style: str = "modern",
+    additional_context: Optional[Dict] = None
+) -> Dict[str, str]:
+    """
+    Async version of generate_website_batched.
+    
+    Uses Gemini's structured output mode, so the response is a JSON object
+    with one HTML string per section rather than markdown to be stripped.
+    
+    Returns:
+        Dictionary mapping section types to HTML
+    """
+    model = _get_model()
+    if not model:
+        raise ValueError("Gemini API key not configured. Please set GEMINI_API_KEY in .env file")
+    
+    ai_prompt = _build_batch_prompt(sections, user_prompt, framework, style, additional_context)
+    
+    response_text = await _generate_content_async(model, ai_prompt, {
+        "temperature": AI_TEMPERATURE,
+        "max_output_tokens": AI_MAX_TOKENS,
+        "response_mime_type": "application/json",
+        "response_schema": {
+            "type": "object",
+            "properties": {section: {"type": "string"} for section in sections},
+            "required": list(sections),
+        },
+    })
+    
+    try:
+        generated = json.loads(response_text)
+    except json.JSONDecodeError as e:
+        # Usually a response cut off at AI_MAX_TOKENS
+        raise Exception(f"AI batch generation returned invalid JSON: {e}")
+    
+    if not isinstance(generated, dict):
+        raise Exception("AI batch generation did not return a JSON object")
+    
+    components = {}
+    for section in sections:
+        html = generated.get(section)
+        if isinstance(html, str) and html.strip():
+            components[section] = html.strip()
+    
+    # Cache per section, so later single-section requests still hit the cache
+    if CACHE_ENABLED:
+        for section, html in components.items():
+            await _cache_component_async(section, user_prompt, framework, style, html)
+    
+    return components
+
+
+# Single-section prompt; filled in with str.format by _build_component_prompt
+_COMPONENT_PROMPT_TEMPLATE = """You are an expert web developer specializing in {framework} framework.
+
+TASK: Generate a professional, production-ready {section_type} section for a website with REAL CONTENT extracted from the user's prompt.
+
+USER REQUIREMENTS:
+- Original prompt: "{user_prompt}"
+- Section type: {section_type}
+- Framework: {framework} 5.3
+- Design style: {style}
+- Brand name: {brand_name}
+- Color scheme: {colors}
+
+CONTENT EXTRACTION RULES:
+{content_hints}
+
+{shared_rules}
+
+{section_requirements}
+
+OUTPUT: Return JSON with a single field "html" containing the component markup, with real content extracted from the prompt. No explanations.
+"""
+
+
 def _build_component_prompt(
     section_type: str,
     user_prompt: str,
@@ -145,22 +529,70 @@ def _build_component_prompt(
     brand_name = context.get("brand_name", "My Website")
     colors = context.get("colors", ["blue", "white"])
     
-    prompt = f"""You are an expert web developer specializing in {framework.upper()} framework.
+    return _COMPONENT_PROMPT_TEMPLATE.format(
+        framework=framework.upper(),
+        section_type=section_type,
+        user_prompt=user_prompt,
+        style=style,
+        brand_name=brand_name,
+        colors=', '.join(colors),
+        content_hints=content_hints,
+        shared_rules=_shared_prompt_rules(framework, style),
+        section_requirements=_get_section_specific_requirements(section_type, framework)
+    )
 
-TASK: Generate a professional, production-ready {section_type} section for a website with REAL CONTENT extracted from the user's prompt.
+
+def _build_batch_prompt(
+    sections: List[str],
+    user_prompt: str,
+    framework: str,
+    style: str,
+    additional_context: Optional[Dict]
+) -> str:
+    """
+    Build one prompt asking Gemini for several sections at once.
+    
+    The framework, style and content rules are sent once for the whole
+    batch; only the content hints and requirements are repeated per section.
+    """
+    context = additional_context or {}
+    brand_name = context.get("brand_name", "My Website")
+    colors = context.get("colors", ["blue", "white"])
+    
+    section_blocks = "\n\n".join(
+        f"""=== SECTION: {section} ===
+CONTENT EXTRACTION RULES:
+{_extract_content_hints(user_prompt, section)}
+{_get_section_specific_requirements(section, framework)}"""
+        for section in sections
+    )
+    
+    return f"""You are an expert web developer specializing in {framework.upper()} framework.
+
+TASK: Generate professional, production-ready sections for one website ({', '.join(sections)}) with REAL CONTENT extracted from the user's prompt. Keep names, tone and content consistent across the sections.
 
 USER REQUIREMENTS:
 - Original prompt: "{user_prompt}"
-- Section type: {section_type}
+- Sections: {', '.join(sections)}
 - Framework: {framework.upper()} 5.3
 - Design style: {style}
 - Brand name: {brand_name}
 - Color scheme: {', '.join(colors)}
 
-CONTENT EXTRACTION RULES:
-{content_hints}
+{_shared_prompt_rules(framework, style)}
+
+{section_blocks}
+
+OUTPUT: Return a single JSON object where each key is a section name and each value is the raw HTML string for that section. Do not wrap values in markdown.
+"""
+
 
-CRITICAL: Analyze the user prompt carefully and extract:
+@functools.lru_cache(maxsize=64)
+def _shared_prompt_rules(framework: str, style: str) -> str:
+    """
+    Content, markup and style rules common to every component prompt.
+    """
+    return f"""CRITICAL: Analyze the user prompt carefully and extract:
 - Business/person names, titles, and roles
 - Product/service descriptions and features
 - Contact information if mentioned
@@ -180,95 +612,107 @@ REQUIREMENTS:
 10. If the prompt mentions specific details (e.g., "shopping site for amazonian warriors"), incorporate that theme throughout
 
 STYLE GUIDELINES FOR "{style}":
-{_get_style_guidelines(style)}
+{_get_style_guidelines(style)}"""
 
-{_get_section_specific_requirements(section_type, framework)}
 
-OUTPUT: Return ONLY the HTML component code with real content extracted from the prompt. No explanations, no markdown code blocks, just pure HTML.
-"""
-    
-    return prompt
+# Business type keywords (checked in this order) and the industry they imply
+_BUSINESS_TYPES = {
+    "shop": "e-commerce/shopping",
+    "store": "e-commerce/retail",
+    "restaurant": "food service",
+    "portfolio": "personal portfolio",
+    "landing": "product landing page",
+    "corporate": "corporate business",
+    "startup": "tech startup",
+    "agency": "creative agency"
+}
+
+# Every business type keyword in one pass; the lookahead keeps overlapping matches
+_BUSINESS_TYPE_RE = re.compile(
+    "(?=(" + "|".join(re.escape(k) for k in sorted(_BUSINESS_TYPES, key=len, reverse=True)) + "))"
+)
+
+# Primary entity: the text after " for ", up to the next " for ", " with " or " using "
+_ENTITY_RE = re.compile(r" for (.*?)(?= for | with | using |\Z)", re.DOTALL)
+
+# Section-specific content requirements
+_SECTION_GUIDANCE = {
+    "hero": "Create a compelling headline and value proposition based on the prompt theme. Include 2 CTA buttons.",
+    "about": "Write an 'About' section that explains the business/person based on prompt context.",
+    "features": "Extract or infer 4-6 key features/services that align with the prompt's business type.",
+    "testimonials": "Generate 3 realistic testimonials relevant to the business type mentioned.",
+    "pricing": "Create 3 pricing tiers appropriate for the business type (Basic, Pro, Premium).",
+    "contact": "Include a contact form with fields relevant to the business type.",
+    "gallery": "Describe 6-8 portfolio items/products that fit the prompt's theme.",
+    "navbar": "Include navigation links relevant to the business type.",
+    "footer": "Add footer content with realistic company info based on the prompt.",
+    "cta": "Write a compelling call-to-action that matches the business goal."
+}
 
 
+@functools.lru_cache(maxsize=256)
 def _extract_content_hints(user_prompt: str, section_type: str) -> str:
     """
     Extract content-specific hints from the user prompt for this section.
+    
+    Memoized: a full website build asks for every section of the same prompt.
+    """
+    hints = list(_prompt_hints(user_prompt))
+    
+    if section_type in _SECTION_GUIDANCE:
+        hints.append(f"- Content goal: {_SECTION_GUIDANCE[section_type]}")
+    
+    # The prompt itself is already quoted under USER REQUIREMENTS
+    hints.append("- Use the prompt's unique elements (e.g., 'amazonian warriors', 'tech startup') in the content")
+    hints.append("- Make content specific and relevant - avoid generic text like 'Lorem ipsum' or 'Your Business'")
+    
+    return "\n".join(hints)
+
+
+@functools.lru_cache(maxsize=64)
+def _prompt_hints(user_prompt: str) -> Tuple[str, ...]:
+    """
+    Content hints that depend only on the prompt, shared by all its sections.
     """
     prompt_lower = user_prompt.lower()
     hints = []
     
     # Extract business type and theme
-    business_types = {
-        "shop": "e-commerce/shopping",
-        "store": "e-commerce/retail",
-        "restaurant": "food service",
-        "portfolio": "personal portfolio",
-        "landing": "product landing page",
-        "corporate": "corporate business",
-        "startup": "tech startup",
-        "agency": "creative agency"
-    }
-    
-    for keyword, btype in business_types.items():
-        if keyword in prompt_lower:
+    found = set(_BUSINESS_TYPE_RE.findall(prompt_lower))
+    for keyword, btype in _BUSINESS_TYPES.items():
+        if keyword in found:
             hints.append(f"- Business type: {btype} - tailor ALL content to this industry")
             break
     
     # Extract names and entities
-    if " for " in prompt_lower:
-        parts = user_prompt.split(" for ")
-        if len(parts) > 1:
-            name = parts[1].split(" with ")[0].split(" using ")[0].strip()
-            hints.append(f"- Primary entity/target: '{name}' - use this name prominently")
-    
-    # Section-specific content requirements
-    section_guidance = {
-        "hero": "Create a compelling headline and value proposition based on the prompt theme. Include 2 CTA buttons.",
-        "about": "Write an 'About' section that explains the business/person based on prompt context.",
-        "features": "Extract or infer 4-6 key features/services that align with the prompt's business type.",
-        "testimonials": "Generate 3 realistic testimonials relevant to the business type mentioned.",
-        "pricing": "Create 3 pricing tiers appropriate for the business type (Basic, Pro, Premium).",
-        "contact": "Include a contact form with fields relevant to the business type.",
-        "gallery": "Describe 6-8 portfolio items/products that fit the prompt's theme.",
-        "navbar": "Include navigation links relevant to the business type.",
-        "footer": "Add footer content with realistic company info based on the prompt.",
-        "cta": "Write a compelling call-to-action that matches the business goal."
-    }
-    
-    if section_type in section_guidance:
-        hints.append(f"- Content goal: {section_guidance[section_type]}")
-    
-    # Extract specific themes/keywords
-    hints.append(f"- Analyze this prompt for specific themes: '{user_prompt}'")
-    hints.append("- Use the prompt's unique elements (e.g., 'amazonian warriors', 'tech startup') in the content")
-    hints.append("- Make content specific and relevant - avoid generic text like 'Lorem ipsum' or 'Your Business'")
+    entity = _ENTITY_RE.search(user_prompt)
+    if entity:
+        hints.append(f"- Primary entity/target: '{entity.group(1).strip()}' - use this name prominently")
     
-    return "\n".join(hints)
+    return tuple(hints)
+
+
+# Design guidance for each style; unknown styles get "modern"
+_STYLE_GUIDELINES = {
+    "modern": "Use clean lines, ample whitespace, gradient backgrounds, rounded corners, shadows",
+    "minimal": "Minimalist design, lots of white space, simple typography, monochrome or limited colors",
+    "corporate": "Professional, trustworthy, blue/gray colors, structured layout, formal tone",
+    "creative": "Vibrant colors, unique layouts, playful elements, artistic flair",
+    "dark": "Dark background, light text, high contrast, modern dark mode aesthetic",
+    "retro": "Vintage elements, classic typography, nostalgic color palette"
+}
 
 
 def _get_style_guidelines(style: str) -> str:
     """
     Get style-specific guidelines for the AI.
     """
-    guidelines = {
-        "modern": "Use clean lines, ample whitespace, gradient backgrounds, rounded corners, shadows",
-        "minimal": "Minimalist design, lots of white space, simple typography, monochrome or limited colors",
-        "corporate": "Professional, trustworthy, blue/gray colors, structured layout, formal tone",
-        "creative": "Vibrant colors, unique layouts, playful elements, artistic flair",
-        "dark": "Dark background, light text, high contrast, modern dark mode aesthetic",
-        "retro": "Vintage elements, classic typography, nostalgic color palette"
-    }
-    return guidelines.get(style, guidelines["modern"])
+    return _STYLE_GUIDELINES.get(style, _STYLE_GUIDELINES["modern"])
 
 
-def _get_section_specific_requirements(section_type: str, framework: str) -> str:
-    """
-    Get section-specific requirements and examples.
-    """
-    
-    if framework.lower() == "bootstrap":
-        requirements = {
-            "navbar": """
+# Per-section requirements and examples for Bootstrap prompts
+_BOOTSTRAP_REQUIREMENTS = {
+    "navbar": """
 NAVBAR REQUIREMENTS:
 - Use navbar-expand-lg for responsive collapse
 - Include brand logo/name
@@ -277,7 +721,7 @@ NAVBAR REQUIREMENTS:
 - Use navbar-dark bg-dark or navbar-light bg-light
 - Example: <nav class="navbar navbar-expand-lg navbar-dark bg-dark">
 """,
-            "hero": """
+    "hero": """
 HERO REQUIREMENTS:
 - Large, eye-catching heading (display-3 or display-4)
 - Compelling subtitle/description
@@ -286,7 +730,7 @@ HERO REQUIREMENTS:
 - Use container and row/col for layout
 - Example: <div class="bg-primary text-white py-5">
 """,
-            "features": """
+    "features": """
 FEATURES REQUIREMENTS:
 - 3-6 feature cards using Bootstrap cards
 - Icons for each feature (use Bootstrap Icons)
@@ -294,7 +738,7 @@ FEATURES REQUIREMENTS:
 - Use row and col-md-4 for 3-column grid
 - Example: <div class="row g-4">
 """,
-            "footer": """
+    "footer": """
 FOOTER REQUIREMENTS:
 - Multi-column layout (3-4 columns)
 - Links, contact info, social media icons
@@ -302,7 +746,7 @@ FOOTER REQUIREMENTS:
 - Use bg-dark text-white
 - Example: <footer class="bg-dark text-white py-5">
 """,
-            "contact": """
+    "contact": """
 CONTACT REQUIREMENTS:
 - Contact form with name, email, subject, message
 - Use Bootstrap form classes (form-control, form-label)
@@ -310,7 +754,7 @@ CONTACT REQUIREMENTS:
 - Optional contact information display
 - Example: <form class="needs-validation">
 """,
-            "gallery": """
+    "gallery": """
 GALLERY REQUIREMENTS:
 - Grid of images (3-4 columns)
 - Use Bootstrap cards with img-top
@@ -318,7 +762,7 @@ GALLERY REQUIREMENTS:
 - Responsive grid (col-md-4 or col-md-3)
 - Example: <div class="row g-3">
 """,
-            "testimonials": """
+    "testimonials": """
 TESTIMONIALS REQUIREMENTS:
 - 3 testimonial cards
 - Avatar image, name, role, quote
@@ -326,7 +770,7 @@ TESTIMONIALS REQUIREMENTS:
 - Use card with card-body
 - Example: <div class="card h-100">
 """,
-            "pricing": """
+    "pricing": """
 PRICING REQUIREMENTS:
 - 3 pricing tiers (Basic, Pro, Enterprise)
 - Price, features list, CTA button
@@ -334,7 +778,7 @@ PRICING REQUIREMENTS:
 - Use cards with centered content
 - Example: <div class="card h-100 border-0 shadow-sm">
 """,
-            "about": """
+    "about": """
 ABOUT REQUIREMENTS:
 - Two-column layout (text + image)
 - Company/person description
@@ -342,7 +786,7 @@ ABOUT REQUIREMENTS:
 - Use row with col-lg-6
 - Example: <div class="row align-items-center">
 """,
-            "cta": """
+    "cta": """
 CTA REQUIREMENTS:
 - Bold, action-oriented heading
 - Persuasive description
@@ -350,37 +794,203 @@ CTA REQUIREMENTS:
 - Use bg-primary or bg-gradient
 - Example: <div class="bg-primary text-white py-5 text-center">
 """
-        }
-        return requirements.get(section_type, "")
+}
+
+
+def _get_section_specific_requirements(section_type: str, framework: str) -> str:
+    """
+    Get section-specific requirements and examples.
+    """
+    if framework.lower() == "bootstrap":
+        return _BOOTSTRAP_REQUIREMENTS.get(section_type, "")
     
     return ""
 
 
-def _extract_html_from_response(response_text: str) -> str:
+# Structured output schema for a single component: {"html": "<section>...</section>"}
+_COMPONENT_SCHEMA = {
+    "type": "object",
+    "properties": {"html": {"type": "string"}},
+    "required": ["html"],
+}
+
+# Start of the "html" value in the JSON response
+_HTML_FIELD_RE = re.compile(r'"html"\s*:\s*"')
+
+# Longest run of complete JSON string characters and escapes
+_JSON_STRING_CHARS_RE = re.compile(r'(?:[^"\\]|\\["\\/bfnrt]|\\u[0-9a-fA-F]{4})*')
+
+# A trailing \uXXXX high surrogate escape (not an escaped backslash followed
+# by "u..."), whose low half may still be on its way
+_HIGH_SURROGATE_RE = re.compile(r'(?:^|[^\\])(?:\\\\)*\\u[dD][89abAB][0-9a-fA-F]{2}$')
+
+
+class _StreamingHTMLExtractor:
     """
-    Extract clean HTML from AI response, removing any markdown or explanations.
+    Incrementally decode the "html" field of a streamed JSON component response.
+    
+    Gemini is asked for {"html": "..."} in structured output mode, so the
+    HTML is one JSON string. feed() decodes it as it streams in, holding
+    back only incomplete escape sequences and trailing whitespace; the
+    joined output equals json.loads(response)["html"].strip().
     """
-    # Remove markdown code blocks if present
-    if "```html" in response_text:
-        parts = response_text.split("```html")
-        if len(parts) > 1:
-            html_part = parts[1].split("```")[0]
-            return html_part.strip()
-    elif "```" in response_text:
-        parts = response_text.split("```")
-        if len(parts) >= 3:
-            return parts[1].strip()
     
-    # If no code blocks, return the whole response (assuming it's HTML)
-    return response_text.strip()
+    def __init__(self):
+        self.buffer = ""      # Raw JSON not yet decoded
+        self.pending = ""     # Decoded trailing whitespace, held back
+        self.state = "field"  # field, value or done
+        self.started = False  # Whether any HTML has been returned yet
+    
+    def feed(self, text: str) -> str:
+        """
+        Add streamed text.
+        
+        Returns:
+            HTML that can be passed on now (possibly empty)
+        """
+        self.buffer += text
+        
+        if self.state == "field":
+            match = _HTML_FIELD_RE.search(self.buffer)
+            if not match:
+                return ""
+            self.buffer = self.buffer[match.end():]
+            self.state = "value"
+        
+        if self.state != "value":
+            return ""
+        
+        end = _JSON_STRING_CHARS_RE.match(self.buffer).end()
+        closed = self.buffer[end:end + 1] == '"'
+        if not closed and _HIGH_SURROGATE_RE.search(self.buffer[:end]):
+            end -= 6
+        
+        decoded = self.pending + json.loads('"' + self.buffer[:end] + '"')
+        self.buffer = self.buffer[end:]
+        
+        if closed:
+            self.state = "done"
+            self.buffer = ""
+            return self._take(decoded.rstrip())
+        
+        safe = decoded.rstrip()
+        self.pending = decoded[len(safe):]
+        return self._take(safe)
+    
+    def close(self) -> str:
+        """
+        Finish the stream.
+        
+        Returns:
+            Any HTML still held back
+        """
+        html = ""
+        if self.state == "field":
+            # Not the expected JSON object; treat the whole response as HTML
+            html = self._take(self.buffer.strip())
+        
+        self.buffer = ""
+        self.pending = ""
+        self.state = "done"
+        return html
+    
+    def _take(self, html: str) -> str:
+        """Return html, dropping leading whitespace if nothing has been returned yet."""
+        if not self.started:
+            html = html.lstrip()
+            self.started = bool(html)
+        return html
 
 
+@functools.lru_cache(maxsize=256)
 def _get_cache_key(section_type: str, user_prompt: str, framework: str, style: str) -> str:
     """
     Generate a cache key for the component.
+    
+    Memoized, so the cache lookup and the later cache write for the same
+    component hash it only once.
     """
-    content = f"{section_type}_{user_prompt}_{framework}_{style}"
-    return hashlib.md5(content.encode()).hexdigest()
+    content = b"\x00".join((
+        section_type.encode(), user_prompt.encode(), framework.encode(), style.encode()
+    ))
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+# Recently used components (cache key -> HTML), in front of the disk cache;
+# least recently used entries are evicted beyond MAX_MEMORY_CACHE_SIZE
+_MEMORY_CACHE: "OrderedDict[str, str]" = OrderedDict()
+MAX_MEMORY_CACHE_SIZE = 512
+
+# Used from the shared event loop thread, to_thread workers and sync callers
+_MEMORY_CACHE_LOCK = threading.Lock()
+
+
+def _remember_component(cache_key: str, html: str):
+    """Store a component in the in-memory cache, evicting the oldest if full."""
+    with _MEMORY_CACHE_LOCK:
+        _MEMORY_CACHE[cache_key] = html
+        _MEMORY_CACHE.move_to_end(cache_key)
+        
+        while len(_MEMORY_CACHE) > MAX_MEMORY_CACHE_SIZE:
+            _MEMORY_CACHE.popitem(last=False)
+
+
+# Disk cache: a single SQLite database in WAL mode rather than a file per
+# component. The SQL strings are constants, so sqlite3's statement cache
+# prepares each one once per connection.
+CACHE_DB_PATH = CACHE_DIR / "ai_cache.sqlite"
+_SELECT_COMPONENT = "SELECT html FROM components WHERE key = ?"
+_INSERT_COMPONENT = (
+    "INSERT OR REPLACE INTO components (key, html, created_at) "
+    "VALUES (?, ?, strftime('%s', 'now'))"
+)
+
+# Shared connection, used from the Gemini loop and write threads under _DB_LOCK
+_DB: Optional[sqlite3.Connection] = None
+_DB_LOCK = threading.Lock()
+
+
+def _get_db() -> sqlite3.Connection:
+    """Open the cache database on first use. Callers must hold _DB_LOCK."""
+    global _DB
+    if _DB is None:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _DB = sqlite3.connect(CACHE_DB_PATH, check_same_thread=False)
+        _DB.execute("PRAGMA journal_mode=WAL")
+        # Safe against corruption in WAL mode; a crash can only lose the latest writes
+        _DB.execute("PRAGMA synchronous=NORMAL")
+        _DB.execute(
+            "CREATE TABLE IF NOT EXISTS components ("
+            "key TEXT PRIMARY KEY, html TEXT NOT NULL, created_at INTEGER NOT NULL)"
+        )
+        _DB.commit()
+    return _DB
+
+
+def _recall_component(cache_key: str) -> Optional[str]:
+    """
+    Look up a component in the in-memory cache.
+    """
+    with _MEMORY_CACHE_LOCK:
+        html = _MEMORY_CACHE.get(cache_key)
+        if html is not None:
+            _MEMORY_CACHE.move_to_end(cache_key)
+        return html
+
+
+def _read_cache_entry(cache_key: str) -> Optional[str]:
+    """
+    Read a component from the disk cache, remembering it in memory.
+    """
+    with _DB_LOCK:
+        row = _get_db().execute(_SELECT_COMPONENT, (cache_key,)).fetchone()
+    
+    if row is None:
+        return None
+    
+    html = row[0]
+    _remember_component(cache_key, html)
+    return html
 
 
 def _get_cached_component(section_type: str, user_prompt: str, framework: str, style: str) -> Optional[str]:
@@ -388,23 +998,52 @@ def _get_cached_component(section_type: str, user_prompt: str, framework: str, s
     Retrieve cached component if available.
     """
     cache_key = _get_cache_key(section_type, user_prompt, framework, style)
-    cache_file = CACHE_DIR / f"{cache_key}.html"
-    
-    if cache_file.exists():
-        return cache_file.read_text(encoding='utf-8')
+    html = _recall_component(cache_key)
+    if html is not None:
+        return html
+    return _read_cache_entry(cache_key)
+
+
+async def _get_cached_component_async(section_type: str, user_prompt: str, framework: str, style: str) -> Optional[str]:
+    """
+    Retrieve cached component without blocking the event loop on disk I/O.
+    """
+    cache_key = _get_cache_key(section_type, user_prompt, framework, style)
+    html = _recall_component(cache_key)
+    if html is not None:
+        return html
+    return await asyncio.to_thread(_read_cache_entry, cache_key)
+
+
+def _write_cache_entry(cache_key: str, html: str):
+    """
+    Write a component to the disk cache.
     
-    return None
+    Each write is its own transaction, so a crash or a concurrent write
+    never leaves a partial entry.
+    """
+    with _DB_LOCK:
+        db = _get_db()
+        with db:
+            db.execute(_INSERT_COMPONENT, (cache_key, html))
 
 
 def _cache_component(section_type: str, user_prompt: str, framework: str, style: str, html: str):
     """
     Cache generated component for future use.
     """
-    CACHE_DIR.mkdir(parents=True, exist_ok=True)
     cache_key = _get_cache_key(section_type, user_prompt, framework, style)
-    cache_file = CACHE_DIR / f"{cache_key}.html"
-    
-    cache_file.write_text(html, encoding='utf-8')
+    _remember_component(cache_key, html)
+    _write_cache_entry(cache_key, html)
+
+
+async def _cache_component_async(section_type: str, user_prompt: str, framework: str, style: str, html: str):
+    """
+    Cache generated component without blocking the event loop on disk I/O.
+    """
+    cache_key = _get_cache_key(section_type, user_prompt, framework, style)
+    _remember_component(cache_key, html)
+    await asyncio.to_thread(_write_cache_entry, cache_key, html)
 
 
 def generate_full_website_with_ai(
@@ -423,7 +1062,7 @@ def generate_full_website_with_ai(
     Returns:
         Dictionary mapping section types to HTML components
     """
-    if not MODEL:
+    if not is_ai_available():
         raise ValueError("Gemini API key not configured")
     
     sections = intent.get("sections", [])
@@ -435,34 +1074,124 @@ def generate_full_website_with_ai(
         "colors": intent.get("colors", ["blue", "white"])
     }
     
-    components = {}
+    if verbose:
+        print(f"  🤖 Generating {len(sections)} sections with Gemini AI...")
     
-    for section in sections:
-        if verbose:
-            print(f"  🤖 Generating {section} with Gemini AI...")
+    generate_sections = _generate_sections_batched if _BATCH_SIZE > 1 else _generate_sections_concurrently
+    results = _run(generate_sections(
+        sections, user_prompt, framework, style, additional_context
+    ))
+    
+    # Results come back in section order, so assembly stays deterministic
+    components = {}
+    for section, result in zip(sections, results):
+        if isinstance(result, Exception):
+            if verbose:
+                print(f"    ❌ {section} failed: {str(result)}")
+            # Will be handled by fallback mechanism
+            components[section] = None
+            continue
         
-        try:
-            html, metadata = generate_component_with_ai(
+        html, metadata = result
+        components[section] = html
+        
+        if verbose:
+            cached_status = "💾 (cached)" if metadata.get("cached") else "✨ (new)"
+            print(f"    ✅ Generated {section} {cached_status}")
+    
+    return components
+
+
+async def _generate_sections_concurrently(
+    sections: List[str],
+    user_prompt: str,
+    framework: str,
+    style: str,
+    additional_context: Dict
+) -> list:
+    """
+    Generate all sections concurrently, at most MAX_CONCURRENT_REQUESTS at a time.
+    
+    Returns:
+        List of (html, metadata) tuples or exceptions, in the same order as sections
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    
+    async def generate(section: str):
+        async with semaphore:
+            return await generate_component_with_ai_async(
                 section_type=section,
                 user_prompt=user_prompt,
                 framework=framework,
                 style=style,
                 additional_context=additional_context
             )
+    
+    return await asyncio.gather(
+        *(generate(section) for section in sections),
+        return_exceptions=True
+    )
+
+
+async def _generate_sections_batched(
+    sections: List[str],
+    user_prompt: str,
+    framework: str,
+    style: str,
+    additional_context: Dict
+) -> list:
+    """
+    Generate all sections _BATCH_SIZE at a time, one Gemini request per batch.
+    
+    Cached sections are not requested again. Sections a batch fails to
+    return are retried one request per section.
+    
+    Returns:
+        List of (html, metadata) tuples or exceptions, in the same order as sections
+    """
+    results = {}
+    pending = []
+    for section in dict.fromkeys(sections):
+        cached_component = await _get_cached_component_async(section, user_prompt, framework, style) if CACHE_ENABLED else None
+        if cached_component:
+            results[section] = (cached_component, {"cached": True, "section_type": section})
+        else:
+            pending.append(section)
+    
+    batches = [pending[i:i + _BATCH_SIZE] for i in range(0, len(pending), _BATCH_SIZE)]
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    
+    async def generate(batch: List[str]):
+        async with semaphore:
+            return await generate_website_batched_async(
+                batch, user_prompt, framework, style, additional_context
+            )
+    
+    outcomes = await asyncio.gather(*(generate(batch) for batch in batches), return_exceptions=True)
+    
+    missing = []
+    for batch, outcome in zip(batches, outcomes):
+        for section in batch:
+            html = None if isinstance(outcome, Exception) else outcome.get(section)
+            if html is None:
+                missing.append(section)
+                continue
             
-            components[section] = html
-            
-            if verbose:
-                cached_status = "💾 (cached)" if metadata.get("cached") else "✨ (new)"
-                print(f"    ✅ Generated {cached_status}")
-                
-        except Exception as e:
-            if verbose:
-                print(f"    ❌ Failed: {str(e)}")
-            # Will be handled by fallback mechanism
-            components[section] = None
+            results[section] = (html, {
+                "section_type": section,
+                "framework": framework,
+                "style": style,
+                "ai_generated": True,
+                "cached": False
+            })
     
-    return components
+    if missing:
+        retried = await _generate_sections_concurrently(
+            missing, user_prompt, framework, style, additional_context
+        )
+        results.update(zip(missing, retried))
+    
+    return [results[section] for section in sections]
 
 
 def is_ai_available() -> bool:
@@ -472,14 +1201,29 @@ def is_ai_available() -> bool:
     Returns:
         True if AI is available, False otherwise
     """
-    return MODEL is not None
+    # The key check comes first: without a key the SDK is never even looked up
+    return AI_CONFIGURED and sdk_installed()
 
 
 def clear_cache():
     """
     Clear all cached AI-generated components.
+    
+    Rows are deleted in place, so the database and directory stay usable
+    by anything writing to the cache at the same time.
     """
-    if CACHE_DIR.exists():
-        import shutil
-        shutil.rmtree(CACHE_DIR)
-        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    with _MEMORY_CACHE_LOCK:
+        _MEMORY_CACHE.clear()
+    if not CACHE_DIR.exists():
+        return
+    
+    with _DB_LOCK:
+        db = _get_db()
+        with db:
+            db.execute("DELETE FROM components")
+    
+    # Components cached as one .html file each, before the SQLite cache
+    with os.scandir(CACHE_DIR) as entries:
+        for entry in entries:
+            if entry.is_file() and entry.name.endswith(".html"):
+                os.unlink(entry.path)
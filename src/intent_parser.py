@@ -21,23 +21,25 @@ Output Format:
 
 import re
 import os
-from typing import Dict, List
+import functools
+from typing import Dict, List, Optional, Set, Tuple
 from dotenv import load_dotenv
 
 load_dotenv()
 
-# Try to import Gemini for AI-powered section selection
-try:
-    import google.generativeai as genai
-    GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
-    if GEMINI_API_KEY and GEMINI_API_KEY != "your_gemini_api_key_here":
-        genai.configure(api_key=GEMINI_API_KEY)
-        AI_MODEL = genai.GenerativeModel(os.getenv("GEMINI_MODEL", "gemini-2.0-flash-exp"))
-        AI_AVAILABLE = True
-    else:
-        AI_AVAILABLE = False
-except ImportError:
-    AI_AVAILABLE = False
+from src.gemini_client import api_key_configured, configure, get_model, sdk_installed
+
+# Gemini is used for AI-powered section selection when a key is set and the
+# SDK is installed; the SDK itself is imported on first use by _get_ai_model()
+GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
+AI_AVAILABLE = api_key_configured(GEMINI_API_KEY) and sdk_installed()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_ai_model():
+    """Configure Gemini and return the section-selection model."""
+    configure(GEMINI_API_KEY)
+    return get_model(os.getenv("GEMINI_MODEL", "gemini-2.0-flash-exp"))
 
 
 # Keyword mappings for section detection
@@ -71,12 +73,85 @@ STYLE_KEYWORDS = {
     "dark": ["dark", "dark mode", "dark theme"],
 }
 
+# Logical page order; only these sections are ever returned
+SECTION_ORDER = ("navbar", "hero", "about", "features", "gallery",
+                 "testimonials", "pricing", "contact", "cta", "footer")
+
 # Color extraction keywords
 COLOR_KEYWORDS = [
     "blue", "red", "green", "yellow", "purple", "pink", "orange", 
     "teal", "cyan", "indigo", "gray", "black", "white"
 ]
 
+# Metadata flags and the keywords that set them
+METADATA_KEYWORDS = {
+    "is_portfolio": ["portfolio"],
+    "is_ecommerce": ["shop", "store", "ecommerce", "e-commerce", "buy", "sell"],
+    "is_landing_page": ["landing"]
+}
+
+
+def _build_keyword_scanner():
+    """
+    Compile every keyword into one pattern for a single pass over the prompt.
+    
+    Returns:
+        Tuple of (compiled pattern, keyword -> ((category, label), ...))
+    """
+    labels = {}
+    groups = [
+        ("section", SECTION_KEYWORDS),
+        ("framework", FRAMEWORK_KEYWORDS),
+        ("style", STYLE_KEYWORDS),
+        ("color", {color: [color] for color in COLOR_KEYWORDS}),
+        ("metadata", METADATA_KEYWORDS),
+    ]
+    for category, keyword_map in groups:
+        for label, keywords in keyword_map.items():
+            for keyword in keywords:
+                labels.setdefault(keyword, []).append((category, label))
+    
+    # The pattern reports the longest keyword starting at each position; every
+    # keyword that is a prefix of it matches there too (e.g. "contact info"
+    # also means "contact"), so each keyword carries its prefixes' labels
+    hits = {
+        keyword: tuple(
+            hit
+            for other, other_hits in labels.items() if keyword.startswith(other)
+            for hit in other_hits
+        )
+        for keyword in labels
+    }
+    
+    # Zero-width lookahead keeps overlapping matches, like a substring test would
+    alternatives = "|".join(re.escape(k) for k in sorted(labels, key=len, reverse=True))
+    return re.compile(f"(?=({alternatives}))"), hits
+
+
+_KEYWORD_RE, _KEYWORD_HITS = _build_keyword_scanner()
+
+# Brand name from a "for X" phrase, e.g. "a landing page for TechStart with ..."
+_BRAND_RE = re.compile(r'for ([A-Z][a-zA-Z0-9\s]+?)(?:\s+with|\s+that|\.|$)')
+
+
+def _scan_keywords(prompt_lower: str) -> Dict[str, Set[str]]:
+    """
+    Find every keyword in the prompt in one pass.
+    
+    Args:
+        prompt_lower: Lowercase version of user prompt
+        
+    Returns:
+        Dictionary of category (section, framework, style, color, metadata) -> matched labels
+    """
+    found = {"section": set(), "framework": set(), "style": set(), "color": set(), "metadata": set()}
+    
+    for match in _KEYWORD_RE.finditer(prompt_lower):
+        for category, label in _KEYWORD_HITS[match.group(1)]:
+            found[category].add(label)
+    
+    return found
+
 
 def parse_intent(user_prompt: str, use_ai: bool = True) -> dict:
     """
@@ -89,36 +164,57 @@ def parse_intent(user_prompt: str, use_ai: bool = True) -> dict:
     Returns:
         Dictionary with sections, framework, style, and other metadata
     """
+    return parse_intent_with_source(user_prompt, use_ai)[0]
+
+
+def parse_intent_with_source(user_prompt: str, use_ai: bool = True) -> Tuple[dict, bool]:
+    """
+    Parse a prompt as parse_intent() does, also reporting how sections were chosen.
+    
+    Args:
+        user_prompt: Natural language description of desired website
+        use_ai: Whether to use AI for intelligent section selection
+        
+    Returns:
+        Tuple of (intent, whether Gemini chose the sections); False means
+        keyword matching was used, by request or because the AI call failed
+    """
     prompt_lower = user_prompt.lower()
     
+    # One keyword pass serves all the extractors below
+    found = _scan_keywords(prompt_lower)
+    
     # Try AI-powered section selection first
+    ai_sections = False
     if use_ai and AI_AVAILABLE:
         try:
             sections = _ai_extract_sections(user_prompt)
+            ai_sections = True
         except:
-            sections = _extract_sections(prompt_lower)
+            sections = _extract_sections(prompt_lower, found)
     else:
-        sections = _extract_sections(prompt_lower)
+        sections = _extract_sections(prompt_lower, found)
     
     # Determine framework (default to bootstrap if not specified)
-    framework = _extract_framework(prompt_lower)
+    framework = _extract_framework(prompt_lower, found)
     
     # Determine style
-    style = _extract_style(prompt_lower)
+    style = _extract_style(prompt_lower, found)
     
     # Extract colors
-    colors = _extract_colors(prompt_lower)
+    colors = _extract_colors(prompt_lower, found)
     
     # Extract additional metadata
-    metadata = _extract_metadata(user_prompt, prompt_lower)
+    metadata = _extract_metadata(user_prompt, prompt_lower, found)
     
-    return {
+    intent = {
         "sections": sections,
         "framework": framework,
         "style": style,
         "colors": colors,
         "metadata": metadata
     }
+    return intent, ai_sections
 
 
 def _ai_extract_sections(user_prompt: str) -> List[str]:
@@ -130,6 +226,9 @@ def _ai_extract_sections(user_prompt: str) -> List[str]:
         
     Returns:
         List of section names
+        
+    Raises:
+        Exception: If the Gemini request fails (parse_intent falls back to keywords)
     """
     ai_prompt = f"""Analyze this website request and determine which sections to include:
 
@@ -158,127 +257,105 @@ Example: navbar,hero,features,gallery,contact,footer
 
 Your response:"""
     
-    try:
-        response = AI_MODEL.generate_content(ai_prompt)
-        section_text = response.text.strip()
-        
-        # Parse AI response
-        sections = [s.strip() for s in section_text.split(',')]
-        
-        # Validate sections
-        valid_sections = ["navbar", "hero", "about", "features", "gallery", 
-                         "testimonials", "pricing", "contact", "cta", "footer"]
-        sections = [s for s in sections if s in valid_sections]
-        
-        # Ensure navbar and footer are always included
-        if "navbar" not in sections:
-            sections.insert(0, "navbar")
-        if "footer" not in sections:
-            sections.append("footer")
-        
-        # Order sections logically
-        section_order = ["navbar", "hero", "about", "features", "gallery", 
-                        "testimonials", "pricing", "contact", "cta", "footer"]
-        ordered_sections = [s for s in section_order if s in sections]
-        
-        return ordered_sections if ordered_sections else ["navbar", "hero", "footer"]
-        
-    except Exception as e:
-        # Fallback to keyword-based extraction
-        return _extract_sections(user_prompt.lower())
+    response = _get_ai_model().generate_content(ai_prompt)
+    section_text = response.text.strip()
+    
+    # Parse AI response; unknown names are dropped by the ordering below
+    sections = {s.strip() for s in section_text.split(',')}
+    
+    # Ensure navbar and footer are always included
+    sections |= {"navbar", "footer"}
+    
+    # Order sections logically
+    return [s for s in SECTION_ORDER if s in sections]
 
 
-def _extract_sections(prompt_lower: str) -> List[str]:
+def _extract_sections(prompt_lower: str, found: Optional[Dict[str, Set[str]]] = None) -> List[str]:
     """
     Extract section names from the prompt.
     
     Args:
         prompt_lower: Lowercase version of user prompt
+        found: Result of _scan_keywords(prompt_lower), if already computed
         
     Returns:
         List of section names to include
     """
-    detected_sections = []
+    if found is None:
+        found = _scan_keywords(prompt_lower)
     
-    for section, keywords in SECTION_KEYWORDS.items():
-        for keyword in keywords:
-            if keyword in prompt_lower:
-                if section not in detected_sections:
-                    detected_sections.append(section)
-                break
+    detected_sections = set(found["section"])
     
     # Default sections if none detected
     if not detected_sections:
-        detected_sections = ["navbar", "hero", "footer"]
+        detected_sections = {"navbar", "hero", "footer"}
     
     # Ensure navbar and footer are always included
-    if "navbar" not in detected_sections:
-        detected_sections.insert(0, "navbar")
-    if "footer" not in detected_sections:
-        detected_sections.append("footer")
+    detected_sections |= {"navbar", "footer"}
     
     # Order sections logically
-    section_order = ["navbar", "hero", "about", "features", "gallery", 
-                     "testimonials", "pricing", "contact", "cta", "footer"]
-    
-    ordered_sections = [s for s in section_order if s in detected_sections]
-    
-    return ordered_sections
+    return [s for s in SECTION_ORDER if s in detected_sections]
 
 
-def _extract_framework(prompt_lower: str) -> str:
+def _extract_framework(prompt_lower: str, found: Optional[Dict[str, Set[str]]] = None) -> str:
     """
     Determine which UI framework to use.
     
     Args:
         prompt_lower: Lowercase version of user prompt
+        found: Result of _scan_keywords(prompt_lower), if already computed
         
     Returns:
         Framework name (default: "bootstrap")
     """
-    for framework, keywords in FRAMEWORK_KEYWORDS.items():
-        for keyword in keywords:
-            if keyword in prompt_lower:
-                return framework
+    if found is None:
+        found = _scan_keywords(prompt_lower)
+    
+    for framework in FRAMEWORK_KEYWORDS:
+        if framework in found["framework"]:
+            return framework
     
     # Default to Bootstrap (best AI generation support)
     return "bootstrap"
 
 
-def _extract_style(prompt_lower: str) -> str:
+def _extract_style(prompt_lower: str, found: Optional[Dict[str, Set[str]]] = None) -> str:
     """
     Determine the style/theme preference.
     
     Args:
         prompt_lower: Lowercase version of user prompt
+        found: Result of _scan_keywords(prompt_lower), if already computed
         
     Returns:
         Style name (default: "modern")
     """
-    for style, keywords in STYLE_KEYWORDS.items():
-        for keyword in keywords:
-            if keyword in prompt_lower:
-                return style
+    if found is None:
+        found = _scan_keywords(prompt_lower)
+    
+    for style in STYLE_KEYWORDS:
+        if style in found["style"]:
+            return style
     
     # Default to modern
     return "modern"
 
 
-def _extract_colors(prompt_lower: str) -> List[str]:
+def _extract_colors(prompt_lower: str, found: Optional[Dict[str, Set[str]]] = None) -> List[str]:
     """
     Extract color preferences from the prompt.
     
     Args:
         prompt_lower: Lowercase version of user prompt
+        found: Result of _scan_keywords(prompt_lower), if already computed
         
     Returns:
         List of color names
     """
-    colors = []
+    if found is None:
+        found = _scan_keywords(prompt_lower)
     
-    for color in COLOR_KEYWORDS:
-        if color in prompt_lower:
-            colors.append(color)
+    colors = [color for color in COLOR_KEYWORDS if color in found["color"]]
     
     # Default colors if none specified
     if not colors:
@@ -287,13 +364,14 @@ def _extract_colors(prompt_lower: str) -> List[str]:
     return colors
 
 
-def _extract_metadata(original_prompt: str, prompt_lower: str) -> Dict:
+def _extract_metadata(original_prompt: str, prompt_lower: str, found: Optional[Dict[str, Set[str]]] = None) -> Dict:
     """
     Extract additional metadata from the prompt.
     
     Args:
         original_prompt: Original user prompt (case-preserved)
         prompt_lower: Lowercase version
+        found: Result of _scan_keywords(prompt_lower), if already computed
         
     Returns:
         Dictionary with additional metadata
@@ -304,21 +382,17 @@ def _extract_metadata(original_prompt: str, prompt_lower: str) -> Dict:
     }
     
     # Extract brand name if mentioned (look for quotes or "for X" pattern)
-    brand_match = re.search(r'for ([A-Z][a-zA-Z0-9\s]+?)(?:\s+with|\s+that|\.|$)', original_prompt)
+    brand_match = _BRAND_RE.search(original_prompt)
     if brand_match:
         metadata["brand_name"] = brand_match.group(1).strip()
     
-    # Check if portfolio is mentioned
-    if "portfolio" in prompt_lower:
-        metadata["is_portfolio"] = True
-    
-    # Check if e-commerce is mentioned
-    if any(word in prompt_lower for word in ["shop", "store", "ecommerce", "e-commerce", "buy", "sell"]):
-        metadata["is_ecommerce"] = True
+    if found is None:
+        found = _scan_keywords(prompt_lower)
     
-    # Check if landing page is mentioned
-    if "landing" in prompt_lower or "landing page" in prompt_lower:
-        metadata["is_landing_page"] = True
+    # Portfolio, e-commerce and landing page flags, in declaration order
+    for flag in METADATA_KEYWORDS:
+        if flag in found["metadata"]:
+            metadata[flag] = True
     
     return metadata
 
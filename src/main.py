@@ -9,6 +9,11 @@ This module ties together all components of the system:
 - Outputs final result
 """
 
+import argparse
+import itertools
+import logging
+import os
+import re
 import sys
 import time
 from pathlib import Path
@@ -18,19 +23,9 @@ from typing import Dict, Tuple, Optional
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-# Import all modules
-from src.intent_parser import parse_intent
-from src.component_mapper import map_sections_to_components
-from src.assembler import assemble_website
-from src.visual_validator import validate_html_string, generate_validation_summary
-from src.fixer import auto_fix_website, generate_fix_summary
-from src.output_manager import (
-    save_website, 
-    generate_summary, 
-    list_outputs, 
-    print_outputs_table,
-    create_deployment_package
-)
+# Characters dropped from a title when it becomes an output filename;
+# \w already covers letters, digits and the underscore
+_SANITIZE_RE = re.compile(r'[^\w \-]+')
 
 
 def build_website(
@@ -39,7 +34,8 @@ def build_website(
     auto_fix: bool = True,
     validate: bool = True,
     verbose: bool = True,
-    use_ai: bool = True
+    use_ai: bool = True,
+    playwright_ctx=None
 ) -> Tuple[bool, Dict]:
     """
     Complete end-to-end website building process.
@@ -51,10 +47,83 @@ def build_website(
         validate: Whether to validate the generated website
         verbose: Whether to print detailed progress
         use_ai: Whether to use AI generation (Gemini) for components
+        playwright_ctx: Optional Playwright BrowserContext shared across builds
+                        (validation opens its pages there instead of a new browser)
         
     Returns:
         Tuple of (success, build_info)
     """
+    # Verbose output is collected in one buffer and written once per stage
+    # (before each stage that can run long or print on its own), rather than
+    # one write per line
+    output = []
+    try:
+        return _build_website(
+            user_prompt, output_name, auto_fix, validate, verbose, use_ai, playwright_ctx, output
+        )
+    finally:
+        _flush(output)
+
+
+def _flush(output: list):
+    """Write buffered build output to stdout in one call and empty the buffer."""
+    if output:
+        sys.stdout.write("".join(output))
+        sys.stdout.flush()
+        output.clear()
+
+
+def _compute_output_path(intent: Dict, output_name: Optional[str]) -> str:
+    """
+    Work out where the built website is saved.
+    
+    Args:
+        intent: Parsed intent (its metadata title names the file)
+        output_name: Custom output filename, if given
+        
+    Returns:
+        Output path under dist/
+    """
+    if output_name:
+        output_path = f"dist/{output_name}"
+        if not output_path.endswith('.html'):
+            output_path += '.html'
+        return output_path
+    
+    # Generate from intent
+    title = intent.get("metadata", {}).get("title", "")
+    if title:
+        # Clean title for filename
+        clean_title = _SANITIZE_RE.sub('', title).replace(' ', '_').lower()
+        return f"dist/{clean_title}.html"
+    return f"dist/website_{int(time.time())}.html"
+
+
+def _build_website(
+    user_prompt: str,
+    output_name: Optional[str],
+    auto_fix: bool,
+    validate: bool,
+    verbose: bool,
+    use_ai: bool,
+    playwright_ctx,
+    output: list
+) -> Tuple[bool, Dict]:
+    """
+    Run the build stages for build_website, buffering verbose output in output.
+    """
+    # Pipeline modules are imported on first build rather than at module
+    # import, so the CLI's usage and --help output don't pay for them
+    from src.cache import cached_parse_intent
+    from src.component_mapper import map_sections_to_components
+    from src.assembler import assemble_website, assemble_website_stream
+    from src.visual_validator import validate_html_string
+    from src.fixer import auto_fix_website
+    from src.output_manager import save_website, save_website_stream, generate_summary
+    
+    def log(message: str = ""):
+        output.append(message + "\n")
+    
     start_time = time.time()
     build_info = {
         "success": False,
@@ -62,42 +131,47 @@ def build_website(
         "output_path": None,
         "errors": []
     }
+    stages = build_info["stages"]
     
     if verbose:
-        print("\n" + "="*70)
-        print("🏗️  TOSHOKAN-CODO - INTELLIGENT WEBSITE ASSEMBLER")
-        print("="*70)
-        print(f"\n📝 User Prompt: \"{user_prompt}\"\n")
+        log("\n" + "="*70)
+        log("🏗️  TOSHOKAN-CODO - INTELLIGENT WEBSITE ASSEMBLER")
+        log("="*70)
+        log(f"\n📝 User Prompt: \"{user_prompt}\"\n")
     
     # Stage 1: Parse Intent
     if verbose:
-        print("Stage 1: 🧠 Parsing Intent...")
+        log("Stage 1: 🧠 Parsing Intent...")
+        _flush(output)
     
     try:
-        intent = parse_intent(user_prompt)
-        build_info["stages"]["intent_parsing"] = {
+        intent = cached_parse_intent(user_prompt)
+        stages["intent_parsing"] = {
             "success": True,
             "data": intent
         }
         
         if verbose:
-            print(f"  ✅ Detected Framework: {intent.get('framework', 'N/A')}")
-            print(f"  ✅ Detected Style: {intent.get('style', 'N/A')}")
-            print(f"  ✅ Sections: {len(intent.get('sections', []))}")
-            if intent.get('sections'):
-                print(f"     {', '.join(intent['sections'][:5])}")
-                if len(intent['sections']) > 5:
-                    print(f"     ... and {len(intent['sections']) - 5} more")
+            sections = intent.get('sections') or []
+            n_sections = len(sections)
+            log(f"  ✅ Detected Framework: {intent.get('framework', 'N/A')}")
+            log(f"  ✅ Detected Style: {intent.get('style', 'N/A')}")
+            log(f"  ✅ Sections: {n_sections}")
+            if sections:
+                log(f"     {', '.join(sections[:5])}")
+                if n_sections > 5:
+                    log(f"     ... and {n_sections - 5} more")
     
     except Exception as e:
         build_info["errors"].append(f"Intent parsing failed: {str(e)}")
         if verbose:
-            print(f"  ❌ Failed: {str(e)}")
+            log(f"  ❌ Failed: {str(e)}")
         return False, build_info
     
     # Stage 2: Map Components
     if verbose:
-        print("\nStage 2: 🗺️  Mapping Components...")
+        log("\nStage 2: 🗺️  Mapping Components...")
+        _flush(output)
     
     try:
         # Pass user_prompt to enable AI generation (if use_ai is True)
@@ -108,14 +182,14 @@ def build_website(
             verbose=verbose
         )
         
-        build_info["stages"]["component_mapping"] = {
+        stages["component_mapping"] = {
             "success": True,
             "mapped_count": len(component_mapping),
             "ai_metadata": ai_metadata
         }
         
         if verbose:
-            print(f"  ✅ Mapped {len(component_mapping)} components")
+            log(f"  ✅ Mapped {len(component_mapping)} components")
             
             # Show AI generation stats if available
             if ai_metadata:
@@ -124,164 +198,174 @@ def build_website(
                 fallback = ai_metadata.get("fallback_used", 0)
                 
                 if ai_generated > 0 or from_cache > 0:
-                    print(f"  🤖 AI Generated: {ai_generated} | Cached: {from_cache} | Fallback: {fallback}")
+                    log(f"  🤖 AI Generated: {ai_generated} | Cached: {from_cache} | Fallback: {fallback}")
             
             # Show component samples
-            for section_type, component_path in list(component_mapping.items())[:3]:
+            for section_type, component_path in itertools.islice(component_mapping.items(), 3):
                 if isinstance(component_path, str) and component_path.startswith("AI_GENERATED:"):
-                    print(f"     {section_type} → 🤖 AI Generated")
+                    log(f"     {section_type} → 🤖 AI Generated")
                 else:
-                    print(f"     {section_type} → {Path(component_path).name}")
+                    log(f"     {section_type} → {os.path.basename(component_path)}")
             if len(component_mapping) > 3:
-                print(f"     ... and {len(component_mapping) - 3} more")
+                log(f"     ... and {len(component_mapping) - 3} more")
     
     except Exception as e:
         build_info["errors"].append(f"Component mapping failed: {str(e)}")
         if verbose:
-            print(f"  ❌ Failed: {str(e)}")
+            log(f"  ❌ Failed: {str(e)}")
         return False, build_info
 
     # Stage 3: Assemble Website
     if verbose:
-        print("\nStage 3: 🔨 Assembling Website...")
+        log("\nStage 3: 🔨 Assembling Website...")
     
     try:
-        html_content = assemble_website(component_mapping, intent)
+        if validate:
+            html_content = assemble_website(component_mapping, intent)
+            # UTF-8 bytes, the same unit save_website_stream reports
+            html_size = len(html_content.encode('utf-8'))
+        else:
+            # Nothing reads the document before it's saved, so its chunks go
+            # straight to disk rather than into one string; Stage 6 reports it
+            html_content = None
+            output_path = _compute_output_path(intent, output_name)
+            saved = save_website_stream(
+                assemble_website_stream(component_mapping, intent), output_path, overwrite=False
+            )
+            html_size = saved[2]
         
-        build_info["stages"]["assembly"] = {
+        stages["assembly"] = {
             "success": True,
-            "html_size": len(html_content)
+            "html_size": html_size
         }
         
         if verbose:
-            size_kb = len(html_content) / 1024
-            print(f"  ✅ Generated {size_kb:.2f} KB of HTML")
-            print(f"  ✅ Complete HTML5 document with {len(component_mapping)} sections")
+            size_kb = html_size / 1024
+            log(f"  ✅ Generated {size_kb:.2f} KB of HTML")
+            log(f"  ✅ Complete HTML5 document with {len(component_mapping)} sections")
     
     except Exception as e:
         build_info["errors"].append(f"Assembly failed: {str(e)}")
         if verbose:
-            print(f"  ❌ Failed: {str(e)}")
+            log(f"  ❌ Failed: {str(e)}")
         return False, build_info
     
     # Stage 4: Visual Validation (Optional)
     validation_report = None
     if validate:
         if verbose:
-            print("\nStage 4: 🔍 Visual Validation...")
+            log("\nStage 4: 🔍 Visual Validation...")
+            _flush(output)
         
         try:
-            validation_report = validate_html_string(html_content, "temp_validation.html")
+            validation_report = validate_html_string(
+                html_content, "temp_validation.html", playwright_ctx=playwright_ctx
+            )
+            issues = validation_report.get("issues") or []
             
-            build_info["stages"]["validation"] = {
+            stages["validation"] = {
                 "success": True,
                 "valid": validation_report["valid"],
-                "issues_count": len(validation_report.get("issues", []))
+                "issues_count": len(issues)
             }
             
             if verbose:
                 status = "✅ PASS" if validation_report["valid"] else "⚠️  ISSUES FOUND"
-                print(f"  {status}")
-                print(f"  Issues: {len(validation_report.get('issues', []))}")
+                log(f"  {status}")
+                log(f"  Issues: {len(issues)}")
                 
-                if validation_report.get("issues"):
+                if issues:
                     # Show first 3 issues
-                    for issue in validation_report["issues"][:3]:
+                    for issue in issues[:3]:
                         severity_icon = {"critical": "🔴", "high": "🟠", "medium": "🟡", "low": "🟢"}.get(
                             issue.get("severity", ""), "⚪"
                         )
-                        print(f"    {severity_icon} {issue.get('description', 'Unknown issue')}")
+                        log(f"    {severity_icon} {issue.get('description', 'Unknown issue')}")
                     
-                    if len(validation_report["issues"]) > 3:
-                        print(f"    ... and {len(validation_report['issues']) - 3} more")
+                    if len(issues) > 3:
+                        log(f"    ... and {len(issues) - 3} more")
         
         except Exception as e:
             build_info["errors"].append(f"Validation failed: {str(e)}")
             if verbose:
-                print(f"  ⚠️  Validation skipped: {str(e)}")
+                log(f"  ⚠️  Validation skipped: {str(e)}")
     
     # Stage 5: Auto-Fix Issues (Optional)
     fix_report = None
     if auto_fix and validation_report and not validation_report["valid"]:
         if verbose:
-            print("\nStage 5: 🔧 Auto-Fixing Issues...")
+            log("\nStage 5: 🔧 Auto-Fixing Issues...")
+            _flush(output)
         
         try:
             html_content, fix_report = auto_fix_website(
                 html_content,
                 validation_report,
-                max_attempts=3
+                max_attempts=3,
+                playwright_ctx=playwright_ctx
             )
+            fixes = fix_report.get("fixes_applied") or []
+            n_fixes = len(fixes)
             
-            build_info["stages"]["fixing"] = {
+            stages["fixing"] = {
                 "success": True,
-                "fixes_applied": len(fix_report.get("fixes_applied", [])),
+                "fixes_applied": n_fixes,
                 "initial_issues": fix_report.get("initial_issues", 0),
                 "final_issues": fix_report.get("final_issues", 0)
             }
             
             if verbose:
-                print(f"  ✅ Applied {len(fix_report.get('fixes_applied', []))} fixes")
-                print(f"  Issues: {fix_report.get('initial_issues', 0)} → {fix_report.get('final_issues', 0)}")
+                log(f"  ✅ Applied {n_fixes} fixes")
+                log(f"  Issues: {fix_report.get('initial_issues', 0)} → {fix_report.get('final_issues', 0)}")
                 
                 # Show fixes
-                for fix in fix_report.get("fixes_applied", [])[:3]:
-                    print(f"    ✓ {fix}")
+                for fix in fixes[:3]:
+                    log(f"    ✓ {fix}")
                 
-                if len(fix_report.get("fixes_applied", [])) > 3:
-                    print(f"    ... and {len(fix_report['fixes_applied']) - 3} more")
+                if n_fixes > 3:
+                    log(f"    ... and {n_fixes - 3} more")
         
         except Exception as e:
             build_info["errors"].append(f"Auto-fix failed: {str(e)}")
             if verbose:
-                print(f"  ⚠️  Auto-fix skipped: {str(e)}")
+                log(f"  ⚠️  Auto-fix skipped: {str(e)}")
     
     # Stage 6: Save Output
     if verbose:
-        print("\nStage 6: 💾 Saving Output...")
+        log("\nStage 6: 💾 Saving Output...")
     
     try:
-        # Generate output filename
-        if output_name:
-            output_path = f"dist/{output_name}"
-            if not output_path.endswith('.html'):
-                output_path += '.html'
+        if html_content is None:
+            success, msg, file_size = saved
         else:
-            # Generate from intent
-            title = intent.get("metadata", {}).get("title", "")
-            if title:
-                # Clean title for filename
-                clean_title = "".join(c if c.isalnum() or c in [' ', '-', '_'] else '' for c in title)
-                clean_title = clean_title.replace(' ', '_').lower()
-                output_path = f"dist/{clean_title}.html"
-            else:
-                output_path = f"dist/website_{int(time.time())}.html"
-        
-        success, msg = save_website(html_content, output_path, overwrite=False)
+            output_path = _compute_output_path(intent, output_name)
+            success, msg = save_website(html_content, output_path, overwrite=False)
+            file_size = None
         
         if success:
             build_info["output_path"] = output_path
-            build_info["stages"]["output"] = {
+            stages["output"] = {
                 "success": True,
                 "path": output_path
             }
             
             if verbose:
-                print(f"  ✅ {msg}")
+                log(f"  ✅ {msg}")
                 
-                # Show file size
-                file_size = Path(output_path).stat().st_size
-                print(f"  📄 Size: {file_size / 1024:.2f} KB ({file_size:,} bytes)")
+                # Show file size (the UTF-8 length of what was just written)
+                if file_size is None:
+                    file_size = len(html_content.encode('utf-8'))
+                log(f"  📄 Size: {file_size / 1024:.2f} KB ({file_size:,} bytes)")
         else:
             build_info["errors"].append(f"Save failed: {msg}")
             if verbose:
-                print(f"  ❌ {msg}")
+                log(f"  ❌ {msg}")
             return False, build_info
     
     except Exception as e:
         build_info["errors"].append(f"Output save failed: {str(e)}")
         if verbose:
-            print(f"  ❌ Failed: {str(e)}")
+            log(f"  ❌ Failed: {str(e)}")
         return False, build_info
     
     # Calculate build time
@@ -298,7 +382,7 @@ def build_website(
             output_path=output_path,
             build_time=build_time
         )
-        print(summary)
+        log(summary)
     
     return True, build_info
 
@@ -334,44 +418,27 @@ def main():
         return
     
     # Parse arguments
-    user_prompt = sys.argv[1]
-    output_name = None
-    validate = True
-    auto_fix = True
-    verbose = True
-    use_ai = True
+    parser = argparse.ArgumentParser(description="Build a website from a natural language description.")
+    parser.add_argument("prompt", help="Description of the website to build")
+    parser.add_argument("--output", help="Custom output filename")
+    parser.add_argument("--no-validate", action="store_true", help="Skip validation")
+    parser.add_argument("--no-fix", action="store_true", help="Skip auto-fixing")
+    parser.add_argument("--no-ai", action="store_true", help="Disable AI generation (use pre-defined components)")
+    parser.add_argument("--quiet", action="store_true", help="Minimal output")
+    args = parser.parse_args()
+    verbose = not args.quiet
     
-    # Parse flags
-    i = 2
-    while i < len(sys.argv):
-        arg = sys.argv[i]
-        
-        if arg == "--output" and i + 1 < len(sys.argv):
-            output_name = sys.argv[i + 1]
-            i += 2
-        elif arg == "--no-validate":
-            validate = False
-            i += 1
-        elif arg == "--no-fix":
-            auto_fix = False
-            i += 1
-        elif arg == "--no-ai":
-            use_ai = False
-            i += 1
-        elif arg == "--quiet":
-            verbose = False
-            i += 1
-        else:
-            i += 1
+    # Per-section warnings from the pipeline go through logging; --quiet hides them
+    logging.basicConfig(level=logging.WARNING if verbose else logging.ERROR, format="%(message)s")
     
     # Build the website
     success, build_info = build_website(
-        user_prompt=user_prompt,
-        output_name=output_name,
-        auto_fix=auto_fix,
-        validate=validate,
+        user_prompt=args.prompt,
+        output_name=args.output,
+        auto_fix=not args.no_fix,
+        validate=not args.no_validate,
         verbose=verbose,
-        use_ai=use_ai
+        use_ai=not args.no_ai
     )
     
     # Exit with appropriate code
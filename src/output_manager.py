@@ -20,7 +20,7 @@ from pathlib import Path
 from datetime import datetime
 import shutil
 import zipfile
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 
 def save_website(html_content: str, output_path: str, overwrite: bool = False) -> Tuple[bool, str]:
@@ -36,23 +36,11 @@ def save_website(html_content: str, output_path: str, overwrite: bool = False) -
         Tuple of (success, message)
     """
     try:
-        output_file = Path(output_path)
+        output_file = _prepare_output_file(output_path, overwrite)
         
-        # Create parent directory if it doesn't exist
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Check if file exists and handle overwrite
-        if output_file.exists() and not overwrite:
-            # Generate unique filename
-            counter = 1
-            stem = output_file.stem
-            while output_file.exists():
-                output_file = output_file.parent / f"{stem}_{counter}{output_file.suffix}"
-                counter += 1
-        
-        # Save the file
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        # Save the file in one write; bytes, like save_website_stream, so
+        # newlines aren't translated on Windows
+        output_file.write_bytes(html_content.encode('utf-8'))
         
         return True, f"Saved to {output_file}"
         
@@ -60,6 +48,69 @@ def save_website(html_content: str, output_path: str, overwrite: bool = False) -
         return False, f"Failed to save: {str(e)}"
 
 
+def save_website_stream(
+    chunks: Iterable[str],
+    output_path: str,
+    overwrite: bool = False
+) -> Tuple[bool, str, int]:
+    """
+    Save HTML to file as it is produced, without holding the whole document.
+    
+    Args:
+        chunks: Consecutive pieces of the HTML document
+            (e.g. from assemble_website_stream)
+        output_path: Path to save the file
+        overwrite: Whether to overwrite existing file
+        
+    Returns:
+        Tuple of (success, message, bytes written)
+        
+    Raises:
+        Any exception raised while producing chunks; the partial file is
+        removed first
+    """
+    try:
+        output_file = _prepare_output_file(output_path, overwrite)
+        f = open(output_file, 'wb')
+    except OSError as e:
+        return False, f"Failed to save: {str(e)}", 0
+    
+    size = 0
+    try:
+        with f:
+            for chunk in chunks:
+                data = chunk.encode('utf-8')
+                f.write(data)
+                size += len(data)
+    except OSError as e:
+        output_file.unlink(missing_ok=True)
+        return False, f"Failed to save: {str(e)}", 0
+    except BaseException:
+        output_file.unlink(missing_ok=True)
+        raise
+    
+    return True, f"Saved to {output_file}", size
+
+
+def _prepare_output_file(output_path: str, overwrite: bool) -> Path:
+    """Create the output directory and pick a free filename unless overwriting."""
+    output_file = Path(output_path)
+    
+    # Create parent directory if it doesn't exist
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    
+    # Check if file exists and handle overwrite
+    if output_file.exists() and not overwrite:
+        # Generate unique filename
+        counter = 1
+        stem = output_file.stem
+        while output_file.exists():
+            output_file = output_file.parent / f"{stem}_{counter}{output_file.suffix}"
+            counter += 1
+    
+    return output_file
+
+
 def copy_assets(framework: str, dist_path: str) -> List[str]:
     """
     Copy necessary framework assets to dist folder.
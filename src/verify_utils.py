@@ -0,0 +1,18 @@
+"""
+Verify Utils Module
+Helpers shared by the debug and verification scripts.
+
+Responsibilities:
+- Report exceptions briefly by default, with the full traceback on request
+"""
+
+import os
+import traceback
+
+
+def print_error(e: Exception):
+    """Print the traceback if VERIFY_VERBOSE is set, else a one-line hint."""
+    if os.getenv("VERIFY_VERBOSE"):
+        traceback.print_exc(limit=10)
+    else:
+        print(f"   {type(e).__name__} (set VERIFY_VERBOSE=1 for the traceback)")
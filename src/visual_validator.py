@@ -28,18 +28,103 @@ Output Format:
 """
 
 from playwright.sync_api import sync_playwright
+from bs4 import BeautifulSoup
+from collections import OrderedDict
 from pathlib import Path
+import atexit
+import copy
+import hashlib
+import os
+import threading
 from typing import Dict, List, Optional
 import time
 
 
-def validate_layout(html_path: str, headless: bool = True) -> dict:
+# Use the C-based lxml parser when available, else the pure-Python one
+try:
+    import lxml
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+
+# Shared Playwright instance and browsers (keyed by headless flag), started on first use
+_PLAYWRIGHT = None
+_BROWSERS = {}
+
+
+def _get_browser(headless: bool = True):
+    """
+    Get a shared Chromium browser, launching it on first use.
+    
+    Launching Chromium is the dominant fixed cost of a validation, so the
+    browser is kept alive for the rest of the process and closed at exit.
+    """
+    global _PLAYWRIGHT
+    
+    browser = _BROWSERS.get(headless)
+    if browser is not None and browser.is_connected():
+        return browser
+    
+    if _PLAYWRIGHT is None:
+        _PLAYWRIGHT = sync_playwright().start()
+    
+    try:
+        browser = _PLAYWRIGHT.chromium.launch(headless=headless)
+    except Exception:
+        if not _BROWSERS:
+            _shutdown_browsers()
+        raise
+    
+    _BROWSERS[headless] = browser
+    return browser
+
+
+@atexit.register
+def _shutdown_browsers():
+    """Close shared browsers and stop Playwright."""
+    global _PLAYWRIGHT
+    
+    for browser in _BROWSERS.values():
+        try:
+            browser.close()
+        except Exception:
+            pass
+    _BROWSERS.clear()
+    
+    if _PLAYWRIGHT is not None:
+        try:
+            _PLAYWRIGHT.stop()
+        except Exception:
+            pass
+        _PLAYWRIGHT = None
+
+
+def new_browser_context(headless: bool = True):
+    """
+    Create a browser context on the shared browser.
+    
+    Callers running many validations can create one context up front and
+    pass it as playwright_ctx; they own it and should close it when done.
+    
+    Args:
+        headless: Whether to run browser in headless mode
+        
+    Returns:
+        Playwright BrowserContext
+    """
+    return _get_browser(headless).new_context(viewport={"width": 1920, "height": 1080})
+
+
+def validate_layout(html_path: str, headless: bool = True, playwright_ctx=None) -> dict:
     """
     Validate website layout using headless browser.
     
     Args:
         html_path: Path to the HTML file to validate
         headless: Whether to run browser in headless mode
+        playwright_ctx: Optional BrowserContext to open the page in
+                        (defaults to a page on the shared browser)
         
     Returns:
         Validation report dictionary
@@ -56,83 +141,84 @@ def validate_layout(html_path: str, headless: bool = True) -> dict:
     issues = []
     metrics = {}
     
-    with sync_playwright() as p:
-        # Launch browser
-        browser = p.chromium.launch(headless=headless)
-        page = browser.new_page(viewport={"width": 1920, "height": 1080})
+    if playwright_ctx is not None:
+        page = playwright_ctx.new_page()
+        page.set_viewport_size({"width": 1920, "height": 1080})
+    else:
+        page = _get_browser(headless).new_page(viewport={"width": 1920, "height": 1080})
+    
+    try:
+        # Load the HTML file
+        page.goto(f"file://{file_path.absolute()}")
+        
+        # Wait for page to load
+        page.wait_for_load_state("networkidle", timeout=5000)
+        time.sleep(0.5)  # Extra wait for animations
         
+        # Run validation checks
         try:
-            # Load the HTML file
-            page.goto(f"file://{file_path.absolute()}")
-            
-            # Wait for page to load
-            page.wait_for_load_state("networkidle", timeout=5000)
-            time.sleep(0.5)  # Extra wait for animations
-            
-            # Run validation checks
-            try:
-                scroll_check = check_scrollability(page)
-                if not scroll_check["valid"]:
-                    issues.extend(scroll_check["issues"])
-                metrics.update(scroll_check["metrics"])
-            except Exception as e:
-                issues.append({
-                    "type": "error",
-                    "severity": "medium",
-                    "description": f"Scroll check error: {str(e)}"
-                })
-            
-            try:
-                overflow_check = check_overflow(page)
-                issues.extend(overflow_check)
-            except Exception as e:
-                issues.append({
-                    "type": "error",
-                    "severity": "medium",
-                    "description": f"Overflow check error: {str(e)}"
-                })
-            
-            try:
-                section_check = check_section_balance(page)
-                issues.extend(section_check["issues"])
-                metrics.update(section_check["metrics"])
-            except Exception as e:
-                issues.append({
-                    "type": "error",
-                    "severity": "medium",
-                    "description": f"Section check error: {str(e)}"
-                })
-            
-            try:
-                responsive_check = check_responsive_behavior(page)
-                issues.extend(responsive_check["issues"])
-            except Exception as e:
-                issues.append({
-                    "type": "error",
-                    "severity": "medium",
-                    "description": f"Responsive check error: {str(e)}"
-                })
-            
-            try:
-                # Check for basic accessibility
-                accessibility_check = check_basic_accessibility(page)
-                issues.extend(accessibility_check["issues"])
-            except Exception as e:
-                issues.append({
-                    "type": "error",
-                    "severity": "medium",
-                    "description": f"Accessibility check error: {str(e)}"
-                })
-            
+            scroll_check = check_scrollability(page)
+            if not scroll_check["valid"]:
+                issues.extend(scroll_check["issues"])
+            metrics.update(scroll_check["metrics"])
         except Exception as e:
             issues.append({
                 "type": "error",
-                "severity": "critical",
-                "description": f"Validation error: {str(e)}"
+                "severity": "medium",
+                "description": f"Scroll check error: {str(e)}"
             })
         
-        finally:
-            browser.close()
+        try:
+            overflow_check = check_overflow(page)
+            issues.extend(overflow_check)
+        except Exception as e:
+            issues.append({
+                "type": "error",
+                "severity": "medium",
+                "description": f"Overflow check error: {str(e)}"
+            })
+        
+        try:
+            section_check = check_section_balance(page)
+            issues.extend(section_check["issues"])
+            metrics.update(section_check["metrics"])
+        except Exception as e:
+            issues.append({
+                "type": "error",
+                "severity": "medium",
+                "description": f"Section check error: {str(e)}"
+            })
+        
+        try:
+            responsive_check = check_responsive_behavior(page)
+            issues.extend(responsive_check["issues"])
+        except Exception as e:
+            issues.append({
+                "type": "error",
+                "severity": "medium",
+                "description": f"Responsive check error: {str(e)}"
+            })
+        
+        try:
+            # Check for basic accessibility
+            accessibility_check = check_basic_accessibility(page)
+            issues.extend(accessibility_check["issues"])
+        except Exception as e:
+            issues.append({
+                "type": "error",
+                "severity": "medium",
+                "description": f"Accessibility check error: {str(e)}"
+            })
+        
+    except Exception as e:
+        issues.append({
+            "type": "error",
+            "severity": "critical",
+            "description": f"Validation error: {str(e)}"
+        })
+    
+    finally:
+        page.close()
     
     # Determine overall validity
     critical_issues = [i for i in issues if i.get("severity") == "critical"]
@@ -411,28 +497,81 @@ def check_basic_accessibility(page) -> dict:
     return {"issues": issues}
 
 
-def validate_html_string(html_content: str, temp_file: str = "temp_validation.html") -> dict:
+def validate_structural(html_content: str) -> dict:
     """
-    Validate HTML content by saving to temp file first.
+    Validate HTML content by parsing it, without launching a browser.
+    
+    Covers the checks that only need the document tree: page title,
+    image alt text and section count. Layout checks (scroll, overflow,
+    responsive behaviour) need a rendered page; see validate_rendered().
     
     Args:
         html_content: HTML content as string
-        temp_file: Temporary file name
         
     Returns:
         Validation report
     """
-    from pathlib import Path
+    issues = []
+    
+    soup = BeautifulSoup(html_content, HTML_PARSER)
+    
+    # Check if page has a title
+    if not soup.title or not soup.title.get_text().strip():
+        issues.append({
+            "type": "accessibility",
+            "severity": "medium",
+            "description": "Page is missing a title tag"
+        })
+    
+    # Check for images without alt text
+    images_without_alt = sum(1 for img in soup.find_all('img') if not img.has_attr('alt'))
+    if images_without_alt > 0:
+        issues.append({
+            "type": "accessibility",
+            "severity": "low",
+            "description": f"{images_without_alt} images missing alt text"
+        })
+    
+    # Check if we have at least some sections
+    section_count = len(soup.find_all(['section', 'nav', 'header', 'footer']))
+    if section_count < 2:
+        issues.append({
+            "type": "structure",
+            "severity": "medium",
+            "description": f"Very few sections detected ({section_count})"
+        })
+    
+    valid = not any(i.get("severity") in ("critical", "high") for i in issues)
     
-    # Save to temp file
-    temp_path = Path("dist") / temp_file
+    return {
+        "valid": valid,
+        "issues": issues,
+        "metrics": {"sections_detected": section_count}
+    }
+
+
+def validate_rendered(html_content: str, temp_file: str = "temp_validation.html",
+                      playwright_ctx=None) -> dict:
+    """
+    Validate HTML content in a headless browser by saving to temp file first.
+    
+    Args:
+        html_content: HTML content as string
+        temp_file: Temporary file name
+        playwright_ctx: Optional BrowserContext to render in
+        
+    Returns:
+        Validation report
+    """
+    # Save to temp file (prefixed with the pid so concurrent builds don't collide)
+    temp_path = Path("dist") / f"{os.getpid()}_{temp_file}"
     temp_path.parent.mkdir(exist_ok=True)
     
     with open(temp_path, 'w', encoding='utf-8') as f:
         f.write(html_content)
     
     # Validate
-    report = validate_layout(str(temp_path))
+    report = validate_layout(str(temp_path), playwright_ctx=playwright_ctx)
     
     # Clean up temp file
     try:
@@ -443,6 +582,69 @@ def validate_html_string(html_content: str, temp_file: str = "temp_validation.ht
     return report
 
 
+def validate_html_string(html_content: str, temp_file: str = "temp_validation.html",
+                         mode: str = "full", playwright_ctx=None) -> dict:
+    """
+    Validate HTML content.
+    
+    Args:
+        html_content: HTML content as string
+        temp_file: Temporary file name (full mode only)
+        mode: "fast" for structural checks only (no browser),
+              "full" to render the page in a headless browser
+        playwright_ctx: Optional BrowserContext to render in (full mode only)
+        
+    Returns:
+        Validation report
+    """
+    if mode not in ("fast", "full"):
+        raise ValueError(f"Unknown validation mode: {mode!r} (expected 'fast' or 'full')")
+    
+    # Identical documents (a rebuilt prompt, an unchanged fix attempt) get
+    # the same report, so it is reused rather than re-rendered
+    cache_key = (mode, hashlib.blake2b(html_content.encode('utf-8'), digest_size=16).digest())
+    with _REPORT_CACHE_LOCK:
+        report = _REPORT_CACHE.get(cache_key)
+        if report is not None:
+            _REPORT_CACHE.move_to_end(cache_key)
+            return copy.deepcopy(report)
+    
+    if mode == "fast":
+        report = validate_structural(html_content)
+    else:
+        report = validate_rendered(html_content, temp_file, playwright_ctx=playwright_ctx)
+    
+    # A check that errored (e.g. a page load timeout) may pass next time
+    if not any(issue.get("type") == "error" for issue in report["issues"]):
+        _remember_report(cache_key, copy.deepcopy(report))
+    return report
+
+
+# Reports for recently validated documents, keyed by (mode, content digest);
+# least recently used entries are evicted beyond MAX_REPORT_CACHE_SIZE
+_REPORT_CACHE: "OrderedDict[tuple, dict]" = OrderedDict()
+_REPORT_CACHE_LOCK = threading.Lock()
+MAX_REPORT_CACHE_SIZE = 32
+
+
+def _remember_report(cache_key: tuple, report: dict):
+    """Store a validation report, evicting the oldest if the cache is full."""
+    with _REPORT_CACHE_LOCK:
+        _REPORT_CACHE[cache_key] = report
+        _REPORT_CACHE.move_to_end(cache_key)
+        
+        while len(_REPORT_CACHE) > MAX_REPORT_CACHE_SIZE:
+            _REPORT_CACHE.popitem(last=False)
+
+
+def clear_validation_cache():
+    """
+    Forget all cached validation reports.
+    """
+    with _REPORT_CACHE_LOCK:
+        _REPORT_CACHE.clear()
+
+
 def generate_validation_summary(report: dict) -> str:
     """
     Generate a human-readable summary of the validation report.
@@ -14,6 +14,7 @@ sys.path.insert(0, str(project_root))
 from src.intent_parser import parse_intent
 from src.component_mapper import map_sections_to_components
 from src.assembler import assemble_website
+from src.verify_utils import print_error
 
 
 def test_ai_generation():
@@ -105,8 +106,7 @@ def test_ai_generation():
         
     except Exception as e:
         print(f"  ❌ Assembly failed: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        print_error(e)
         return False
     
     # Test cache persistence
@@ -150,6 +150,5 @@ if __name__ == "__main__":
         sys.exit(0 if success else 1)
     except Exception as e:
         print(f"\n❌ Test failed with error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        print_error(e)
         sys.exit(1)
@@ -2,6 +2,7 @@
 import os
 from dotenv import load_dotenv
 import google.generativeai as genai
+from src.verify_utils import print_error
 
 load_dotenv()
 
@@ -19,7 +20,6 @@ if GEMINI_API_KEY and GEMINI_API_KEY != "your_gemini_api_key_here":
         print(f"✅ Response: {response.text}")
     except Exception as e:
         print(f"❌ Error: {e}")
-        import traceback
-        traceback.print_exc()
+        print_error(e)
 else:
     print("❌ No valid API key configured")
@@ -12,8 +12,10 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 from src.assembler import (
     read_component,
+    clear_component_cache,
     fill_placeholders,
     assemble_website,
+    assemble_website_stream,
     create_standalone_page,
     _prepare_template_data,
     _get_framework_head,
@@ -45,6 +47,29 @@ def test_read_component_not_found():
     print("✓ Test: Read component (not found)")
 
 
+def test_read_component_cache():
+    """Test that component reads are cached until the file changes."""
+    component_path = "components/_cache_test.html"
+    full_path = Path(__file__).parent.parent / component_path
+    clear_component_cache()
+    
+    try:
+        full_path.write_text("<p>first</p>", encoding='utf-8')
+        assert read_component(component_path) == "<p>first</p>"
+        assert read_component(component_path) is read_component(component_path), \
+            "Unchanged file should come from the cache"
+        
+        full_path.write_text("<p>second</p>", encoding='utf-8')
+        stat = full_path.stat()
+        os.utime(full_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert read_component(component_path) == "<p>second</p>", \
+            "Modified file should be re-read"
+    finally:
+        full_path.unlink(missing_ok=True)
+        clear_component_cache()
+    print("✓ Test: Read component (cache)")
+
+
 def test_fill_placeholders():
     """Test filling template placeholders."""
     template_html = "<h1>{{ title }}</h1><p>{{ description }}</p>"
@@ -196,6 +221,30 @@ def test_assemble_with_custom_data():
     print("✓ Test: Assemble with custom data")
 
 
+def test_assemble_website_stream():
+    """Test streaming assembly yields the same document in chunks."""
+    intent = {
+        "sections": ["navbar", "hero", "footer"],
+        "framework": "tailwind",
+        "metadata": {"brand_name": "StreamSite"}
+    }
+    
+    component_map = {
+        "navbar": "components/tailwind/nav1.html",
+        "hero": "components/tailwind/hero1.html",
+        "footer": "components/tailwind/footer1.html"
+    }
+    
+    chunks = list(assemble_website_stream(component_map, intent))
+    
+    assert len(chunks) > 2, "Should yield head, components and footer separately"
+    assert chunks[0].startswith("<!DOCTYPE html>"), "First chunk should open the document"
+    assert chunks[-1].rstrip().endswith("</html>"), "Last chunk should close the document"
+    assert "".join(chunks) == assemble_website(component_map, intent), \
+        "Joined chunks should match assemble_website"
+    print("✓ Test: Assemble website stream")
+
+
 def test_assemble_end_to_end():
     """Test complete end-to-end assembly flow."""
     # Parse intent
@@ -321,6 +370,7 @@ def run_all_tests():
     tests = [
         test_read_component,
         test_read_component_not_found,
+        test_read_component_cache,
         test_fill_placeholders,
         test_fill_placeholders_with_defaults,
         test_prepare_template_data,
@@ -331,6 +381,7 @@ def run_all_tests():
         test_get_body_class,
         test_assemble_website,
         test_assemble_with_custom_data,
+        test_assemble_website_stream,
         test_assemble_end_to_end,
         test_create_standalone_page,
         test_create_standalone_with_custom_data,
@@ -6,7 +6,9 @@ Tests the mapping of sections to component file paths.
 import sys
 import os
 import json
+import tempfile
 from pathlib import Path
+from unittest import mock
 
 # Add parent directory to path to import src modules
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -18,7 +20,10 @@ from src.component_mapper import (
     validate_component_paths,
     add_component_to_registry,
     get_component_stats,
-    _select_component
+    _select_component,
+    _load_registry_entry,
+    _flat_registry_index,
+    REGISTRY_PATH
 )
 from src.intent_parser import parse_intent
 
@@ -33,6 +38,19 @@ def test_load_component_registry():
     print("✓ Test: Load component registry")
 
 
+def test_load_component_registry_cached():
+    """Test that the registry is parsed once and callers get independent copies."""
+    assert _load_registry_entry(REGISTRY_PATH)[1] is _load_registry_entry(REGISTRY_PATH)[1], "Unchanged registry should come from the cache"
+    
+    first = load_component_registry()
+    first["tailwind"]["hero"].append("modified.html")
+    get_available_components("tailwind")["hero"].append("modified.html")
+    
+    assert "modified.html" not in load_component_registry()["tailwind"]["hero"], "Callers should not share the cached registry"
+    assert "modified.html" not in get_available_components("tailwind")["hero"], "Callers should not share the cached lists"
+    print("✓ Test: Load component registry (cached)")
+
+
 def test_map_sections_to_components():
     """Test mapping sections to component paths."""
     intent = {
@@ -183,6 +201,52 @@ def test_selection_strategy_round_robin():
     print("✓ Test: Selection strategy - round_robin")
 
 
+def test_selection_strategy_round_robin_rotates():
+    """Test that 'round_robin' cycles through every component."""
+    components = ["comp1.html", "comp2.html", "comp3.html"]
+    selected = [
+        _select_component(components, "round_robin", "rotation_test_section")
+        for _ in range(len(components) * 2)
+    ]
+    
+    assert sorted(selected[:3]) == components, "Should use each component once per cycle"
+    assert selected[:3] == selected[3:], "Should repeat the same order"
+    print("✓ Test: Selection strategy - round_robin rotates")
+
+
+def test_first_strategy_mapping_cached():
+    """Test that repeated 'first' mappings match and are independent copies."""
+    intent = {
+        "sections": ["navbar", "hero", "footer"],
+        "framework": "tailwind"
+    }
+    
+    first_map, _ = map_sections_to_components(intent, use_ai=False, verbose=False)
+    first_map["hero"] = "modified.html"
+    second_map, _ = map_sections_to_components(intent, use_ai=False, verbose=False)
+    
+    assert second_map["hero"] != "modified.html", "Cached mapping should not be shared with callers"
+    assert list(second_map) == ["navbar", "hero", "footer"], "Should keep section order"
+    print("✓ Test: First strategy mapping (cached)")
+
+
+def test_add_component_failed_save_leaves_cache():
+    """Test that a failed registry save doesn't change the cached registry."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        registry_path = str(Path(tmp_dir) / "registry.json")
+        Path(registry_path).write_text(json.dumps({"tailwind": {"hero": ["hero_1.html"]}}))
+        _flat_registry_index(registry_path, _load_registry_entry(registry_path)[0])
+        
+        with mock.patch("src.component_mapper.os.replace", side_effect=OSError("disk full")):
+            assert not add_component_to_registry("tailwind", "hero", "hero_2.html", registry_path)
+        
+        signature, registry = _load_registry_entry(registry_path)
+        assert registry["tailwind"]["hero"] == ["hero_1.html"], "Unsaved component should not be cached"
+        index = _flat_registry_index(registry_path, signature)
+        assert index[("tailwind", "hero")] == ["hero_1.html"], "Unsaved component should not be selectable"
+    print("✓ Test: Add component (failed save leaves cache)")
+
+
 def test_all_sections_have_components():
     """Test that all common sections have Tailwind components."""
     common_sections = ["navbar", "hero", "features", "footer", "gallery", 
@@ -245,6 +309,7 @@ def run_all_tests():
     
     tests = [
         test_load_component_registry,
+        test_load_component_registry_cached,
         test_map_sections_to_components,
         test_map_with_intent_parser,
         test_framework_selection,
@@ -257,6 +322,9 @@ def run_all_tests():
         test_selection_strategy_first,
         test_selection_strategy_random,
         test_selection_strategy_round_robin,
+        test_selection_strategy_round_robin_rotates,
+        test_first_strategy_mapping_cached,
+        test_add_component_failed_save_leaves_cache,
         test_all_sections_have_components,
         test_component_paths_format,
         test_end_to_end_mapping,
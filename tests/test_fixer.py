@@ -20,6 +20,7 @@ from src.fixer import (
 )
 from bs4 import BeautifulSoup
 from pathlib import Path
+from unittest import mock
 
 
 def test_1_analyze_scroll_issues():
@@ -363,6 +364,62 @@ def test_15_fix_from_file():
     print("✅ PASS")
 
 
+def test_16_head_only_fixes_match_soup():
+    """Test that string-only <head> fixes give the same document as the soup path"""
+    print("\nTest 16: Head-only fixes...")
+    
+    html = '<html><head><meta charset="utf-8"></head><body><header>Hi</header></body></html>'
+    actions = analyze_issues({
+        "issues": [
+            {"type": "responsive", "severity": "high", "description": "Mobile issues"},
+            {"type": "scroll", "severity": "medium", "description": "Not scrollable"},
+            {"type": "accessibility", "severity": "medium", "description": "Missing title"}
+        ]
+    })
+    # Drop the CSS fix that needs the parsed document
+    actions = [a for a in actions if a["type"] != "add_responsive_css"]
+    
+    fixed_html, applied = apply_fixes(html, actions)
+    
+    soup = BeautifulSoup(html, 'lxml')
+    for action in actions:
+        if action["type"] == "add_viewport_meta":
+            apply_viewport_meta_fix(soup)
+        elif action["type"] == "add_title":
+            apply_title_fix(soup, action["value"])
+        elif action["type"] == "add_min_height":
+            apply_min_height_fix(soup, action)
+    
+    assert len(applied) == 3
+    assert str(BeautifulSoup(fixed_html, 'lxml')) == str(soup)
+    
+    print("✅ PASS")
+
+
+def test_17_last_attempt_validates_on_read():
+    """Test that the last attempt's validation only runs when its result is read"""
+    print("\nTest 17: Last attempt validates on read...")
+    
+    report = {
+        "valid": False,
+        "issues": [{"type": "accessibility", "severity": "high", "description": "Page is missing a title tag"}]
+    }
+    fixed_report = {"valid": True, "issues": []}
+    
+    with mock.patch("src.visual_validator.validate_html_string", return_value=fixed_report) as validate:
+        fixed_html, fix_report = auto_fix_website("<html><head></head><body></body></html>", report, max_attempts=1)
+        
+        assert "<title>" in fixed_html
+        assert fix_report["attempts"] == 1
+        assert validate.call_count == 0, "Should not validate until final_issues or success is read"
+        
+        assert fix_report["final_issues"] == 0
+        assert fix_report["success"] == True
+        assert validate.call_count == 1, "Should validate once, on first read"
+    
+    print("✅ PASS")
+
+
 def run_all_tests():
     """Run all fixer tests"""
     print("\n" + "="*70)
@@ -385,6 +442,8 @@ def run_all_tests():
         test_13_priority_sorting,
         test_14_idempotent_fixes,
         test_15_fix_from_file,
+        test_16_head_only_fixes_match_soup,
+        test_17_last_attempt_validates_on_read,
     ]
     
     passed = 0
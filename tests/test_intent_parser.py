@@ -5,6 +5,9 @@ Tests the natural language to JSON conversion functionality.
 
 import sys
 import os
+import tempfile
+from pathlib import Path
+from unittest import mock
 
 # Add parent directory to path to import src modules
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -17,6 +20,8 @@ from src.intent_parser import (
     _extract_colors,
     _extract_metadata
 )
+from src import cache, intent_parser
+from src.cache import cached_parse_intent, intent_cache_stats
 
 
 def test_basic_portfolio_prompt():
@@ -205,6 +210,47 @@ def test_complex_prompt():
     print("✓ Test: Complex realistic prompt")
 
 
+def test_cached_parse_intent():
+    """Test that repeated prompts reuse the cached intent."""
+    prompt = "Build a minimal gallery site for Cache Test Studio"
+    first = cached_parse_intent(prompt, use_ai=False)
+    hits_before = intent_cache_stats()["hits"]
+    
+    second = cached_parse_intent(prompt, use_ai=False)
+    assert second == first == parse_intent(prompt, use_ai=False)
+    assert intent_cache_stats()["hits"] == hits_before + 1
+    
+    # Each call gets its own copy
+    second["sections"].append("pricing")
+    assert "pricing" not in cached_parse_intent(prompt, use_ai=False)["sections"]
+    print("✓ Test: Cached intent parsing")
+
+
+def test_cached_parse_intent_skips_ai_fallback():
+    """Test that a keyword fallback after a failed AI call isn't reused."""
+    prompt = "Build a site for Fallback Test Studio"
+    
+    with tempfile.TemporaryDirectory() as tmp_dir, \
+            mock.patch.object(cache, "INTENT_CACHE_DIR", Path(tmp_dir)), \
+            mock.patch.object(intent_parser, "AI_AVAILABLE", True), \
+            mock.patch.object(intent_parser, "_ai_extract_sections") as ai_extract:
+        ai_extract.side_effect = TimeoutError("Gemini timed out")
+        fallback = cached_parse_intent(prompt)
+        
+        ai_extract.side_effect = None
+        ai_extract.return_value = ["navbar", "pricing", "footer"]
+        retried = cached_parse_intent(prompt)
+        
+        assert fallback["sections"] != retried["sections"]
+        assert retried["sections"] == ["navbar", "pricing", "footer"], "Should retry the AI call"
+        assert ai_extract.call_count == 2
+        
+        # The successful parse is reused from then on
+        assert cached_parse_intent(prompt) == retried
+        assert ai_extract.call_count == 2
+    print("✓ Test: Cached intent parsing (AI fallback not reused)")
+
+
 def run_all_tests():
     """Run all tests and report results."""
     print("\n" + "="*60)
@@ -226,6 +272,8 @@ def run_all_tests():
         test_extract_framework_helper,
         test_extract_colors_helper,
         test_complex_prompt,
+        test_cached_parse_intent,
+        test_cached_parse_intent_skips_ai_fallback,
     ]
     
     passed = 0
@@ -8,6 +8,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 from src.output_manager import (
     save_website,
+    save_website_stream,
     copy_assets,
     list_outputs,
     print_outputs_table,
@@ -367,6 +368,33 @@ def test_15_outputs_table_format():
     print("✅ PASS")
 
 
+def test_16_save_website_stream():
+    """Test saving HTML chunks as they are produced"""
+    print("\nTest 16: Save website stream...")
+    
+    chunks = ["<html><body>", "<h1>Café</h1>", "</body></html>"]
+    success, msg, size = save_website_stream(iter(chunks), "dist/test_stream.html", overwrite=True)
+    
+    assert success == True
+    assert "test_stream.html" in msg
+    assert Path("dist/test_stream.html").read_text(encoding='utf-8') == "".join(chunks)
+    assert size == Path("dist/test_stream.html").stat().st_size
+    
+    # A failure while producing chunks propagates and leaves no partial file
+    def failing_chunks():
+        yield "<html>"
+        raise ValueError("render failed")
+    
+    try:
+        save_website_stream(failing_chunks(), "dist/test_stream_failed.html", overwrite=True)
+        assert False, "Expected ValueError"
+    except ValueError:
+        pass
+    assert not Path("dist/test_stream_failed.html").exists()
+    
+    print("✅ PASS")
+
+
 def run_all_tests():
     """Run all output manager tests"""
     print("\n" + "="*70)
@@ -389,6 +417,7 @@ def run_all_tests():
         test_13_list_outputs_empty_dir,
         test_14_save_return_values,
         test_15_outputs_table_format,
+        test_16_save_website_stream,
     ]
     
     passed = 0
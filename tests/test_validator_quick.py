@@ -205,6 +205,32 @@ def test_8_validate_existing_file():
         print("⚠️  SKIP - No HTML files in dist/")
 
 
+def test_9_structural_mode():
+    """Test fast validation without a browser"""
+    print("\nTest 9: Structural (fast) mode...")
+    
+    html = """
+    <!DOCTYPE html>
+    <html>
+    <head><title></title></head>
+    <body>
+        <section><img src="a.png"><img src="b.png" alt="B"></section>
+    </body>
+    </html>
+    """
+    
+    report = validate_html_string(html, mode="fast")
+    descriptions = [i["description"] for i in report["issues"]]
+    
+    assert report["valid"] is True
+    assert "Page is missing a title tag" in descriptions
+    assert "1 images missing alt text" in descriptions
+    assert "Very few sections detected (1)" in descriptions
+    assert report["metrics"]["sections_detected"] == 1
+    
+    print("✅ PASS")
+
+
 def run_tests():
     """Run all tests"""
     print("\n" + "="*70)
@@ -220,6 +246,7 @@ def run_tests():
         test_6_report_structure,
         test_7_well_formed_website,
         test_8_validate_existing_file,
+        test_9_structural_mode,
     ]
     
     passed = 0
@@ -9,7 +9,8 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 from src.visual_validator import (
     validate_layout,
     validate_html_string,
-    generate_validation_summary
+    generate_validation_summary,
+    clear_validation_cache
 )
 from pathlib import Path
 
@@ -426,6 +427,24 @@ def test_valid_website_passes():
     print(f"✅ Well-formed website passes. Total issues: {len(report['issues'])} (only low/medium)")
 
 
+def test_validation_report_cached():
+    """Test that identical HTML reuses its validation report"""
+    print("\nTest 15: Reuse report for identical HTML...")
+    
+    html = "<html><head></head><body><section>One</section></body></html>"
+    clear_validation_cache()
+    
+    first = validate_html_string(html, mode="fast")
+    first["issues"].clear()  # Callers may modify their report
+    second = validate_html_string(html, mode="fast")
+    
+    assert second["issues"], "Cached report should be unaffected by changes to an earlier copy"
+    assert second == validate_html_string(html, mode="fast")
+    assert second is not validate_html_string(html, mode="fast")
+    
+    print("✅ Identical HTML reuses its validation report")
+
+
 def run_all_tests():
     """Run all visual validator tests"""
     print("\n" + "="*70)
@@ -447,6 +466,7 @@ def run_all_tests():
         test_section_detection_accuracy,
         test_validation_report_structure,
         test_valid_website_passes,
+        test_validation_report_cached,
     ]
     
     passed = 0